@@ -2,32 +2,64 @@
 Simulate some actions for the Racer.
 """
 import logging
+from typing import Optional
+
+from agent.archive import PostArchive
 
 LOGGER = logging.getLogger(__name__)
 
 class ActionSimulator:
     """
     Simulates social media actions.
-    LOGGER config should be set to DEBUG level to see the noisy actions
+    LOGGER config should be set to DEBUG level to see the noisy actions.
+    With an archive every post, reply and mention is recorded along with the racer, race and stage
+    taken from the optional context.
     """
+    def __init__(self, archive: Optional[PostArchive] = None):
+        self.archive = archive
+
+    def _archive(self, kind: str, text: str, context: Optional[dict]):
+        if self.archive is None:
+            return
+        context = context or {}
+        self.archive.record(
+            kind, text, racer_name=context.get("racer_name"), race_name=context.get("race_name"),
+            stage=context.get("stage")
+        )
+
     def reply_to_comment(
             self, generated_reply_text: str, original_comment: str, 
-            commenter: str = "Trixie"
+            commenter: str = "Trixie", context: Optional[dict] = None
             ):
         # TODO: If there was an actual replying API, the logic would go here
         LOGGER.debug(f"Action: Replying to {commenter}'s comment ('{original_comment}')")
         LOGGER.debug(f"Agent Reply: \"{generated_reply_text}\"")
+        self._archive("reply", generated_reply_text, context)
 
-    def post_status_update(self, generated_post_text: str):
+    def post_status_update(self, generated_post_text: str, context: Optional[dict] = None):
         # TODO: If there was an actual posting API, the logic would go here
         LOGGER.debug(f"Action: Posting new status update:")
         LOGGER.debug(f"Agent Post: \"{generated_post_text}\"")
+        self._archive("post", generated_post_text, context)
 
     def like_post(self, post_content: str, author: str = "Trixie"):
         # TODO: If there was an actual liking API, the logic would go here
         LOGGER.info(f'Action: Liking post from {author}: {post_content}')
 
-    def mention_entity(self, entity_name: str, generated_text_with_mention: str):
+    def mention_entity(self, entity_name: str, generated_text_with_mention: str, context: Optional[dict] = None):
         # TODO: If there was an actual mentioning API, the logic would go here
         LOGGER.debug(f"Action: Mentioning {entity_name} in a post.")
         LOGGER.debug(f"Agent Post with Mention: \"{generated_text_with_mention}\"")
+        self._archive("mention", generated_text_with_mention, context)
+
+    def mention_entities(self, posts: list, context: Optional[dict] = None):
+        """
+        Dispatches a batch of mention posts, given as (entities, text) pairs, in one go.
+        """
+        # TODO: If there was an actual mentioning API with batch support, the logic would go here
+        LOGGER.debug(f"Action: Mentioning {sum(len(entities) for entities, _ in posts)} entities in {len(posts)} posts.")
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            for entities, text in posts:
+                LOGGER.debug(f"Agent Post with Mention ({', '.join(entities)}): \"{text}\"")
+        for _, text in posts:
+            self._archive("mention", text, context)
@@ -0,0 +1,221 @@
+"""
+Append-only archive of everything the agent posts. Indexed by exact text, racer, race and stage, plus
+a MinHash index over the most recent posts to catch near duplicates before they go out.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from collections import defaultdict, deque
+from typing import NamedTuple, Optional
+
+
+LOGGER = logging.getLogger(__name__)
+
+NORMALIZE_PATTERN = re.compile(r"\s+")
+
+
+class ArchivedPost(NamedTuple):
+    post_id: int
+    kind: str
+    text: str
+    racer_name: Optional[str]
+    race_name: Optional[str]
+    stage: Optional[str]
+    timestamp: float
+
+
+def _stage_key(stage) -> Optional[str]:
+    # Stage members are stored by name so the log stays plain JSON
+    return getattr(stage, "name", stage)
+
+
+class PostArchive:
+    """
+    Every post, reply and mention in the order they were made. With a `path` every record is also
+    appended to a JSON lines file, which is loaded back on start.
+
+    Near duplicates are found with MinHash sketches of the character n-grams. Only the last `window`
+    posts are sketched and indexed by bands of `rows` sketch values (locality sensitive hashing), so a
+    lookup only compares against recent posts sharing a whole band with the text, not the whole window.
+    """
+    def __init__(
+            self, path: Optional[str] = None, window: int = 256, ngram_size: int = 4, sketch_size: int = 32,
+            rows: int = 4, threshold: float = 0.7
+            ):
+        if sketch_size % rows:
+            raise ValueError(f"sketch_size ({sketch_size}) must be a multiple of rows ({rows})")
+        self.path = path
+        self.window = window
+        self.ngram_size = ngram_size
+        self.sketch_size = sketch_size
+        self.rows = rows
+        self.threshold = threshold
+
+        self.posts: list = []
+        self._by_digest: dict = defaultdict(list)
+        self._by_racer: dict = defaultdict(list)
+        self._by_race: dict = defaultdict(list)
+        self._by_stage: dict = defaultdict(list)
+        # Recent window, post IDs in posting order, post ID -> sketch and band -> recent post IDs
+        self._recent_ids: deque = deque()
+        self._recent: dict = {}
+        self._band_index: dict = defaultdict(set)
+
+        if path and os.path.exists(path):
+            self._load(path)
+
+    def __len__(self):
+        return len(self.posts)
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return NORMALIZE_PATTERN.sub(" ", text.lower()).strip()
+
+    @staticmethod
+    def _digest(normalized: str) -> str:
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+    def sketch(self, text: str) -> tuple:
+        """
+        One permutation MinHash of the text's character n-grams: the hashes are split into
+        `sketch_size` bins and the smallest hash of every bin is kept, None for an empty bin. A single
+        pass instead of one per hash function. Uses the builtin string hash, so sketches are rebuilt
+        rather than stored.
+        """
+        normalized = self._normalize(text)
+        n = self.ngram_size
+        size = self.sketch_size
+        sketch = [None] * size
+        for i in range(max(len(normalized) - n + 1, 1)):
+            value = hash(normalized[i:i + n])
+            current = sketch[value % size]
+            if current is None or value < current:
+                sketch[value % size] = value
+        return tuple(sketch)
+
+    @staticmethod
+    def similarity(first: tuple, second: tuple) -> float:
+        """
+        Estimated Jaccard similarity of two texts, the share of bins where their sketches agree.
+        """
+        agree = used = 0
+        for a, b in zip(first, second):
+            if a is None and b is None:
+                continue
+            used += 1
+            agree += a == b
+        return agree / used if used else 1.0
+
+    def _bands(self, sketch: tuple):
+        rows = self.rows
+        for start in range(0, self.sketch_size, rows):
+            yield start, sketch[start:start + rows]
+
+    def _candidates(self, sketch: tuple) -> set:
+        candidates = set()
+        for band in self._bands(sketch):
+            candidates.update(self._band_index.get(band, ()))
+        return candidates
+
+    def _load(self, path: str):
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    self._index(entry["kind"], entry["text"], entry.get("racer_name"), entry.get("race_name"),
+                                entry.get("stage"), entry["timestamp"])
+                except (ValueError, KeyError) as e:
+                    LOGGER.warning(f"Skipping malformed archive line {line_number} in {path}: {e}")
+        LOGGER.info(f"Loaded {len(self.posts)} archived posts from {path}")
+
+    def _index(
+            self, kind: str, text: str, racer_name: Optional[str], race_name: Optional[str], stage: Optional[str],
+            timestamp: float
+            ) -> ArchivedPost:
+        post = ArchivedPost(len(self.posts), kind, text, racer_name, race_name, stage, timestamp)
+        self.posts.append(post)
+        self._by_digest[self._digest(self._normalize(text))].append(post.post_id)
+        if racer_name is not None:
+            self._by_racer[racer_name].append(post.post_id)
+        if race_name is not None:
+            self._by_race[race_name].append(post.post_id)
+        if stage is not None:
+            self._by_stage[stage].append(post.post_id)
+
+        sketch = self.sketch(text)
+        self._recent_ids.append(post.post_id)
+        self._recent[post.post_id] = sketch
+        for band in self._bands(sketch):
+            self._band_index[band].add(post.post_id)
+        if len(self._recent_ids) > self.window:
+            oldest = self._recent_ids.popleft()
+            for band in self._bands(self._recent.pop(oldest)):
+                ids = self._band_index[band]
+                ids.discard(oldest)
+                if not ids:
+                    del self._band_index[band]
+        return post
+
+    def record(
+            self, kind: str, text: str, racer_name: Optional[str] = None, race_name: Optional[str] = None,
+            stage=None, now: Optional[float] = None
+            ) -> ArchivedPost:
+        """
+        Appends a post of the given kind e.g. post, reply or mention.
+        """
+        post = self._index(kind, text, racer_name, race_name, _stage_key(stage), time.time() if now is None else now)
+        if self.path:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(post._asdict(), ensure_ascii=False) + "\n")
+        return post
+
+    def _scored_candidates(self, text: str, racer_name: Optional[str]):
+        sketch = self.sketch(text)
+        for post_id in self._candidates(sketch):
+            post = self.posts[post_id]
+            if racer_name is None or post.racer_name == racer_name:
+                yield post, self.similarity(sketch, self._recent[post_id])
+
+    def nearest(self, text: str, racer_name: Optional[str] = None) -> tuple:
+        """
+        The most similar recent post, by `racer_name` if given, and its similarity. (None, 0.0) if no
+        recent post shares a band with the text.
+        """
+        return max(self._scored_candidates(text, racer_name), key=lambda entry: entry[1], default=(None, 0.0))
+
+    def is_near_duplicate(self, text: str, racer_name: Optional[str] = None) -> bool:
+        # Stops at the first recent post that is similar enough
+        return any(score >= self.threshold for _, score in self._scored_candidates(text, racer_name))
+
+    def find(self, text: str) -> list:
+        """
+        Every archived post with exactly this text, ignoring case and whitespace.
+        """
+        return [self.posts[post_id] for post_id in self._by_digest.get(self._digest(self._normalize(text)), ())]
+
+    def query(self, racer_name: Optional[str] = None, race_name: Optional[str] = None, stage=None) -> list:
+        """
+        Archived posts matching every given filter, oldest first. Starts from the smallest matching
+        index and checks the other filters on those posts only.
+        """
+        stage = _stage_key(stage)
+        filters = [
+            (index, key, field) for index, key, field in (
+                (self._by_racer, racer_name, "racer_name"),
+                (self._by_race, race_name, "race_name"),
+                (self._by_stage, stage, "stage"),
+            ) if key is not None
+        ]
+        if not filters:
+            return list(self.posts)
+        smallest = min(filters, key=lambda entry: len(entry[0].get(entry[1], ())))
+        posts = (self.posts[post_id] for post_id in smallest[0].get(smallest[1], ()))
+        return [
+            post for post in posts
+            if all(getattr(post, field) == key for _, key, field in filters)
+        ]
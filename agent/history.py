@@ -0,0 +1,149 @@
+"""
+Compact race history for the agent's season
+"""
+from array import array
+from typing import Optional
+
+from project.const import Result, Stage
+
+
+_STAGE_ORDINALS = {stage: i for i, stage in enumerate(Stage)}
+_RESULT_ORDINALS = {result: i for i, result in enumerate(Result)}
+_QUALIFYING = {Stage.Q1, Stage.Q2, Stage.Q3}
+_ORDINALS = {
+    1: "first", 2: "second", 3: "third", 4: "fourth", 5: "fifth",
+    6: "sixth", 7: "seventh", 8: "eighth", 9: "ninth", 10: "tenth",
+}
+
+
+def ordinal_word(number: int) -> str:
+    """
+    1 -> first, 12 -> 12th.
+    """
+    if number in _ORDINALS:
+        return _ORDINALS[number]
+    suffix = "th" if 10 <= number % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
+    return f"{number}{suffix}"
+
+
+def result_position(result: Result) -> Optional[int]:
+    """
+    Finishing position for a result, Top 3/Top 5 count as 3rd/5th and a DNF has none.
+    """
+    if result == Result.DNF:
+        return None
+    if result == Result.TOP_3:
+        return 3
+    if result == Result.TOP_5:
+        return 5
+    return int(result.value[1:])
+
+
+class RaceHistory:
+    """
+    Every recorded result as parallel array columns (stage, result and race index) plus aggregates
+    that are updated as results come in, so streaks, bests and averages are read in constant time.
+    Recording a second result for the same named race and stage replaces the first one, results
+    recorded without a race name are always kept as new entries.
+    """
+    _AGGREGATES = (
+        "win_streak", "podium_streak", "points_streak", "races", "finishes", "finish_total",
+        "dnfs", "best_race", "best_qualifying", "new_best_qualifying",
+    )
+
+    def __init__(self):
+        self.stages = array("B")
+        self.results = array("B")
+        self.race_indexes = array("I")
+        self._race_names: dict = {}
+        self._current_race = 0
+        # Race name the last result was recorded with, None if it was recorded without one
+        self._last_race_name: Optional[str] = None
+
+        self.win_streak = 0
+        self.podium_streak = 0
+        self.points_streak = 0
+        self.races = 0
+        self.finishes = 0
+        self.finish_total = 0
+        self.dnfs = 0
+        self.best_race: Optional[int] = None
+        self.best_qualifying: Optional[int] = None
+        self.new_best_qualifying = False
+        # Aggregates before the last record, to replace it in O(1) when it is corrected
+        self._previous: Optional[tuple] = None
+
+    def __len__(self):
+        return len(self.stages)
+
+    def race_index(self, race_name: Optional[str] = None) -> int:
+        """
+        Index of a race in the season, new race names get the next index. Without a name the
+        current race is used.
+        """
+        if race_name is None:
+            return self._current_race
+        index = self._race_names.get(race_name)
+        if index is None:
+            index = len(self._race_names)
+            self._race_names[race_name] = index
+        self._current_race = index
+        return index
+
+    def record(self, stage: Stage, result: Result, race_name: Optional[str] = None):
+        race = self.race_index(race_name)
+        stage_ordinal = _STAGE_ORDINALS[stage]
+        # Only a result for an explicitly named race can be a correction, unnamed results for the
+        # same stage are taken as results of different races
+        if race_name is not None and race_name == self._last_race_name and self.stages[-1] == stage_ordinal:
+            # A correction of the last result, undo it before applying the new one
+            self._restore(self._previous)
+            self.results[-1] = _RESULT_ORDINALS[result]
+        else:
+            self.stages.append(stage_ordinal)
+            self.results.append(_RESULT_ORDINALS[result])
+            self.race_indexes.append(race)
+        self._last_race_name = race_name
+        self._previous = tuple(getattr(self, name) for name in self._AGGREGATES)
+        self._update(stage, result_position(result))
+
+    def _restore(self, aggregates: tuple):
+        for name, value in zip(self._AGGREGATES, aggregates):
+            setattr(self, name, value)
+
+    def _update(self, stage: Stage, position: Optional[int]):
+        self.new_best_qualifying = False
+        if stage == Stage.RACE:
+            self.races += 1
+            if position is None:
+                self.dnfs += 1
+            else:
+                self.finishes += 1
+                self.finish_total += position
+                if self.best_race is None or position < self.best_race:
+                    self.best_race = position
+            self.win_streak = self.win_streak + 1 if position == 1 else 0
+            self.podium_streak = self.podium_streak + 1 if position is not None and position <= 3 else 0
+            self.points_streak = self.points_streak + 1 if position is not None and position <= 10 else 0
+        elif stage in _QUALIFYING and position is not None:
+            if self.best_qualifying is None or position < self.best_qualifying:
+                # Only worth shouting about once there was an earlier qualifying to beat
+                self.new_best_qualifying = self.best_qualifying is not None
+                self.best_qualifying = position
+
+    def form(self) -> dict:
+        """
+        Season form for the context, built from the aggregates only.
+        """
+        return {
+            "results_recorded": len(self.stages),
+            "races": self.races,
+            "win_streak": self.win_streak,
+            "podium_streak": self.podium_streak,
+            "points_streak": self.points_streak,
+            "dnfs": self.dnfs,
+            "best_race": self.best_race,
+            "best_qualifying": self.best_qualifying,
+            "new_best_qualifying": self.new_best_qualifying,
+            "average_race_finish": round(self.finish_total / self.finishes, 2) if self.finishes else None,
+        }
@@ -0,0 +1,67 @@
+"""
+Track how the fans feel over the race weekend
+"""
+import math
+import time
+from array import array
+from typing import Optional
+
+
+class MoodTracker:
+    """
+    Exponentially weighted averages of fan comment sentiment over a few time windows. Every window
+    lives in a fixed-size array so an update is O(1) and the comment history is never re-scanned.
+    """
+    # Window name and half-life in seconds
+    WINDOWS = (
+        ("session", 15 * 60),
+        ("day", 6 * 60 * 60),
+        ("weekend", 72 * 60 * 60),
+    )
+
+    def __init__(self, tone_threshold: float = 0.25, min_weight: float = 3.0):
+        self.tone_threshold = tone_threshold
+        # Minimum decayed comment count before a window is trusted to set the tone
+        self.min_weight = min_weight
+        self._decay_rates = array("d", (math.log(2) / half_life for _, half_life in self.WINDOWS))
+        self.averages = array("d", [0.0] * len(self.WINDOWS))
+        self.weights = array("d", [0.0] * len(self.WINDOWS))
+        self.last_update: Optional[float] = None
+
+    def update(self, score: float, now: Optional[float] = None):
+        """
+        Folds a compound sentiment score (-1 to 1) into every window.
+        """
+        now = time.monotonic() if now is None else now
+        elapsed = 0.0 if self.last_update is None else max(now - self.last_update, 0.0)
+        self.last_update = now
+        for i, rate in enumerate(self._decay_rates):
+            weight = self.weights[i] * math.exp(-rate * elapsed)
+            self.averages[i] = (self.averages[i] * weight + score) / (weight + 1.0)
+            self.weights[i] = weight + 1.0
+
+    def _weight_at(self, i: int, now: float) -> float:
+        if self.last_update is None:
+            return 0.0
+        return self.weights[i] * math.exp(-self._decay_rates[i] * max(now - self.last_update, 0.0))
+
+    def tone(self, now: Optional[float] = None) -> Optional[str]:
+        """
+        Returns 'upbeat', 'tense' or None for a neutral crowd. The shortest window with enough recent
+        comments wins, so a sudden swing during a session shows up before the weekend average moves.
+        """
+        now = time.monotonic() if now is None else now
+        for i in range(len(self.WINDOWS)):
+            if self._weight_at(i, now) >= self.min_weight:
+                if self.averages[i] >= self.tone_threshold:
+                    return "upbeat"
+                if self.averages[i] <= -self.tone_threshold:
+                    return "tense"
+                return None
+        return None
+
+    def snapshot(self) -> dict:
+        """
+        Current average per window, windows without any comments read as 0.
+        """
+        return {name: round(self.averages[i], 3) for i, (name, _) in enumerate(self.WINDOWS)}
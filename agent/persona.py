@@ -0,0 +1,51 @@
+"""
+Racer personas as lightweight overlays on the shared base templates
+"""
+import string
+import sys
+from typing import Optional
+
+from project.const import PERSONA_VARIABLES, template_placeholders
+
+
+class Persona:
+    """
+    A racer's voice on top of the base corpus. Only the overridden buckets and the persona variables
+    (car name, signature hashtags) are stored per persona, every other bucket is read from the base
+    templates that all generators share. Variables are filled in when a template is rendered.
+    """
+    __slots__ = ("name", "overrides", "variables")
+
+    DEFAULT_VARIABLES = {
+        "car_name": "Mach 5",
+        "car_tag": "Mach5",
+        "signature_hashtag": "#GoMachGo",
+    }
+
+    def __init__(self, name: str, variables: Optional[dict] = None, overrides: Optional[dict] = None):
+        self.name = sys.intern(name)
+        self.variables = {key: sys.intern(value) for key, value in {**self.DEFAULT_VARIABLES, **(variables or {})}.items()}
+        missing = PERSONA_VARIABLES - self.variables.keys()
+        if missing:
+            raise ValueError(f"Persona '{name}' is missing variables: {', '.join(sorted(missing))}")
+        self.overrides: dict = {}
+        for bucket, template_list in (overrides or {}).items():
+            self.override(bucket, template_list)
+
+    def override(self, bucket: str, template_list: list):
+        """
+        Replaces a bucket for this persona only, the base corpus is never touched.
+        """
+        allowed = template_placeholders(bucket) | self.variables.keys()
+        for template in template_list:
+            unknown = {field for _, field, _, _ in string.Formatter().parse(template) if field} - allowed
+            if unknown:
+                raise ValueError(f"Persona '{self.name}' override for '{bucket}' uses unknown placeholders: {', '.join(sorted(unknown))}")
+        # Interned so personas overriding with the same text share the strings
+        self.overrides[sys.intern(bucket)] = tuple(sys.intern(template) for template in template_list)
+
+    def __repr__(self):
+        return f"Persona({self.name!r}, overrides={list(self.overrides)})"
+
+
+DEFAULT_PERSONA = Persona("Go Mifune")
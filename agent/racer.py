@@ -1,31 +1,44 @@
 """
 Racer specific context
 """
+import logging
+from typing import Optional
+
 from agent.actions import ActionSimulator
+from agent.archive import PostArchive
+from agent.spam_filter import FilterAction, SpamFilter
 from agent.state import AgentState
 from agent.text_generator import TextGenerator
+from agent.utils import sentiment_analysis
 from project.const import Result, Stage
 
 
+LOGGER = logging.getLogger(__name__)
+
 class Racer:
-    def __init__(self, text_generator: TextGenerator, racer_name: str, team_name: str):
-        self.state = AgentState(racer_name, team_name)
+    def __init__(
+            self, text_generator: TextGenerator, racer_name: str, team_name: str,
+            spam_filter: Optional[SpamFilter] = None, fuzzy_parsing: bool = False,
+            archive: Optional[PostArchive] = None
+            ):
+        self.state = AgentState(racer_name, team_name, fuzzy_parsing=fuzzy_parsing)
         self.state.racer_name = racer_name
         self.state.team_name = team_name
         self.text_generator = text_generator
-        self.action_simulator = ActionSimulator()
+        self.action_simulator = ActionSimulator(archive)
+        self.spam_filter = spam_filter
 
-    def update_context_stage(self, new_stage: Stage):
+    def update_context_stage(self, new_stage: Stage, confidence: float = 1.0):
         """
         Example stages: FP1, Q3, RACE.
         """
-        self.state.update_stage(new_stage)
+        self.state.update_stage(new_stage, confidence)
 
-    def record_race_result(self, result: str):
+    def record_race_result(self, result: str, race_name: Optional[str] = None):
         """
         Example results: 'P1', 'P5', 'DNF'.
         """
-        self.state.record_result(result)
+        self.state.record_result(result, race_name)
 
     def post_update(self, race_name: str):
         """
@@ -34,17 +47,34 @@ class Racer:
         context = self.state.get_context()
         context["race_name"] = race_name
         post_text = self.text_generator.generate_post(context)
-        self.action_simulator.post_status_update(post_text)
+        self.action_simulator.post_status_update(post_text, context)
         return post_text
 
-    def reply_to_fan(self, fan_comment: str, race_name):
+    def reply_to_fan(self, fan_comment: str, race_name, commenter: Optional[str] = None):
         """
-        Call reply action.
+        Call reply action. Comments dropped by the spam filter get no reply and return None.
+        Without a commenter the comment is treated as coming from an unknown fan.
         """
+        filter_action = FilterAction.ALLOW
+        if self.spam_filter is not None:
+            decision = self.spam_filter.check(fan_comment, commenter)
+            if decision.action == FilterAction.DROP:
+                LOGGER.info(f"Dropped comment from {commenter or 'an unknown fan'} as spam ({', '.join(decision.reasons)})")
+                return None
+            filter_action = decision.action
+
+        # Score once here so the fan mood and the reply share the same sentiment
+        compound_score = None
+        if filter_action != FilterAction.DEPRIORITIZE:
+            compound_score = sentiment_analysis(fan_comment)
+            self.state.record_fan_sentiment(compound_score)
+
         context = self.state.get_context()
         context["race_name"] = race_name
+        context["filter_action"] = filter_action
+        context["comment_sentiment"] = compound_score
         reply_text = self.text_generator.generate_reply(context, fan_comment)
-        self.action_simulator.reply_to_comment(reply_text, fan_comment)
+        self.action_simulator.reply_to_comment(reply_text, fan_comment, commenter or "Trixie", context)
         return reply_text
 
     def like_post(self, post_content: str, author: str = "Trixie"):
@@ -63,5 +93,23 @@ class Racer:
         if not entity_to_mention:
             entity_to_mention = "team"
         mention_text = self.text_generator.generate_mention_post(context, entity_to_mention, base_message)
-        self.action_simulator.mention_entity(entity_to_mention, mention_text)
+        self.action_simulator.mention_entity(entity_to_mention, mention_text, context)
         return mention_text
+
+    def mention_many(
+            self, entities: list, base_message: str, race_name: str, merge: bool = False, max_length: int = 280
+            ) -> list:
+        """
+        Shout-out to many entities with one message. The context, sentiment and hashtags are worked out
+        once and the posts are dispatched as a single batch. With `merge` several entities share a post
+        as long as it stays within `max_length` characters, entities that do not fit are skipped.
+        """
+        # Drop blanks and repeats but keep the order they were given in
+        entities = list(dict.fromkeys(entity for entity in entities if entity))
+        if not entities:
+            return []
+        context = self.state.get_context()
+        context["race_name"] = race_name
+        posts = self.text_generator.generate_mention_posts(context, entities, base_message, merge, max_length)
+        self.action_simulator.mention_entities(posts, context)
+        return [text for _, text in posts]
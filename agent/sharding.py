@@ -0,0 +1,395 @@
+"""
+Sharded runtime for running many racers across local worker processes. A consistent-hash ring maps
+racer IDs to workers, so adding or removing a worker only moves the racers whose owner changed.
+"""
+import bisect
+import hashlib
+import logging
+import multiprocessing
+import time
+from collections import deque
+from typing import Optional
+
+from agent.persona import Persona
+from agent.racer import Racer
+from agent.spam_filter import SpamFilter
+from agent.text_generator import TemplateBasedTextGenerator
+from agent.utils import sentiment_analysis
+from project.const import Result, Stage, match_stage_input
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ShardError(RuntimeError):
+    pass
+
+
+class HashRing:
+    """
+    Consistent-hash ring with virtual nodes. Every node is placed on the ring `replicas` times to
+    spread the keys evenly, a key belongs to the first node clockwise from its hash.
+    """
+    def __init__(self, nodes=(), replicas: int = 128):
+        self.replicas = replicas
+        self._hashes: list = []
+        self._owners: list = []
+        self.nodes: set = set()
+        for node in nodes:
+            self.add(node)
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+    def add(self, node: str):
+        if node in self.nodes:
+            return
+        self.nodes.add(node)
+        for replica in range(self.replicas):
+            point = self._hash(f"{node}#{replica}")
+            i = bisect.bisect(self._hashes, point)
+            self._hashes.insert(i, point)
+            self._owners.insert(i, node)
+
+    def remove(self, node: str):
+        if node not in self.nodes:
+            return
+        self.nodes.remove(node)
+        keep = [(point, owner) for point, owner in zip(self._hashes, self._owners) if owner != node]
+        self._hashes = [point for point, _ in keep]
+        self._owners = [owner for _, owner in keep]
+
+    def get(self, key: str) -> str:
+        if not self._hashes:
+            raise ShardError("The hash ring has no workers")
+        i = bisect.bisect(self._hashes, self._hash(key)) % len(self._hashes)
+        return self._owners[i]
+
+
+def _worker_main(conn, worker_id: str):
+    """
+    Worker process loop. Owns its racers and one warmed text generator, answers every request with
+    an (ok, result) pair in the order the requests came in.
+    """
+    text_generator = TemplateBasedTextGenerator()
+    # Warm up the templates, the string formatting and the sentiment analyzer before taking traffic
+    text_generator.generate_post({"stage": Stage.RACE, "result": Result.P1, "team_name": "Warm Up"})
+    sentiment_analysis("Warming up the engines!")
+    racers: dict = {}
+
+    def make_generator(racer_name: str, persona_variables: Optional[dict], persona_overrides: Optional[dict]):
+        if not persona_variables and not persona_overrides:
+            return text_generator
+        return TemplateBasedTextGenerator(persona=Persona(racer_name, persona_variables, persona_overrides))
+
+    def get_racer(racer_id: str) -> Racer:
+        racer = racers.get(racer_id)
+        if racer is None:
+            raise KeyError(f"Racer '{racer_id}' is not registered on {worker_id}")
+        return racer
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        op = message[0]
+        try:
+            if op == "stop":
+                conn.send((True, None))
+                break
+            elif op == "ping":
+                result = {"worker": worker_id, "racers": len(racers)}
+            elif op == "register":
+                _, racer_id, racer_name, team_name, persona_variables, persona_overrides, use_spam_filter = message
+                racers[racer_id] = Racer(
+                    make_generator(racer_name, persona_variables, persona_overrides), racer_name, team_name,
+                    spam_filter=SpamFilter() if use_spam_filter else None
+                )
+                result = None
+            elif op == "export":
+                # A copy for another worker, the racer stays here until the front sends "drop". The
+                # generator is rebuilt on the other side
+                racer = get_racer(message[1])
+                if racer.text_generator is text_generator:
+                    persona_variables = persona_overrides = None
+                else:
+                    persona_variables = racer.text_generator.persona.variables
+                    persona_overrides = racer.text_generator.persona.overrides
+                result = (racer.state, racer.spam_filter, persona_variables, persona_overrides)
+            elif op == "import":
+                _, racer_id, state, spam_filter, persona_variables, persona_overrides = message
+                racer = Racer(
+                    make_generator(state.racer_name, persona_variables, persona_overrides), state.racer_name,
+                    state.team_name, spam_filter=spam_filter
+                )
+                racer.state = state
+                racers[racer_id] = racer
+                result = None
+            elif op == "drop":
+                racers.pop(message[1], None)
+                result = None
+            elif op == "stage":
+                racer = get_racer(message[1])
+                stage_match = match_stage_input(message[2], fuzzy=racer.state.fuzzy_parsing)
+                if stage_match is None:
+                    raise ValueError(f"Invalid stage input: '{message[2]}'")
+                racer.update_context_stage(stage_match.value, stage_match.confidence)
+                result = stage_match.value.name
+            elif op == "result":
+                get_racer(message[1]).record_race_result(*message[2:])
+                result = None
+            elif op == "post":
+                result = get_racer(message[1]).post_update(message[2])
+            elif op == "reply":
+                result = get_racer(message[1]).reply_to_fan(*message[2:])
+            elif op == "mention":
+                result = get_racer(message[1]).mention(*message[2:])
+            elif op == "mention_many":
+                result = get_racer(message[1]).mention_many(*message[2:])
+            elif op == "like":
+                result = get_racer(message[1]).like_post(*message[2:])
+            else:
+                raise ValueError(f"Unknown operation: {op}")
+            conn.send((True, result))
+        except Exception as e:
+            conn.send((False, f"{type(e).__name__}: {e}"))
+    conn.close()
+
+
+class _Worker:
+    def __init__(self, worker_id: str, context):
+        self.worker_id = worker_id
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, worker_id), name=f"f1-shard-{worker_id}", daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        # Responses still owed for requests that timed out or were abandoned, skipped before the
+        # next request
+        self.stale = 0
+
+    def drain(self, timeout: float = 5.0):
+        try:
+            while self.stale:
+                if not self.conn.poll(timeout):
+                    raise ShardError(f"{self.worker_id} still owes {self.stale} responses after {timeout}s")
+                self.conn.recv()
+                self.stale -= 1
+        except (OSError, EOFError) as e:
+            raise ShardError(f"{self.worker_id} is not reachable: {type(e).__name__}: {e}") from e
+
+    def receive(self, timeout: float = 30.0):
+        """
+        The next response. If none comes within `timeout` it is counted as stale and skipped once it
+        does arrive.
+        """
+        try:
+            if not self.conn.poll(timeout):
+                self.stale += 1
+                raise ShardError(f"{self.worker_id} did not answer within {timeout}s")
+            return self.conn.recv()
+        except (OSError, EOFError) as e:
+            raise ShardError(f"{self.worker_id} is not reachable: {type(e).__name__}: {e}") from e
+
+    def send(self, message: tuple):
+        try:
+            self.conn.send(message)
+        except (OSError, EOFError) as e:
+            raise ShardError(f"{self.worker_id} is not reachable: {type(e).__name__}: {e}") from e
+
+
+class ShardedRuntime:
+    """
+    Front process routing commands by racer ID to local worker processes over pipes. Every worker
+    owns the AgentState of its racers.
+    """
+    def __init__(
+            self, workers: int = 2, replicas: int = 128, window: int = 64, start_method: Optional[str] = None,
+            timeout: float = 30.0
+            ):
+        self._context = multiprocessing.get_context(start_method)
+        self.ring = HashRing(replicas=replicas)
+        # Requests in flight per worker before the front stops to read responses
+        self.window = window
+        # Seconds to wait for any one response before giving up on the worker
+        self.timeout = timeout
+        self._workers: dict = {}
+        self._racers: dict = {}
+        self._next_worker = 0
+        for _ in range(workers):
+            self.add_worker()
+
+    @property
+    def workers(self) -> list:
+        return list(self._workers)
+
+    def _request(self, worker_id: str, message: tuple):
+        worker = self._workers[worker_id]
+        worker.drain(self.timeout)
+        worker.send(message)
+        ok, result = worker.receive(self.timeout)
+        if not ok:
+            raise ShardError(f"{worker_id}: {result}")
+        return result
+
+    def _migrate(self, racer_ids: list):
+        """
+        Moves racers to whichever worker the ring now assigns them to. A racer is only dropped from its
+        old worker once the new one has imported it, so a failed move leaves it where it was.
+        """
+        for racer_id in racer_ids:
+            source = self._racers[racer_id]
+            target = self.ring.get(racer_id)
+            if source == target:
+                continue
+            exported = self._request(source, ("export", racer_id))
+            self._request(target, ("import", racer_id, *exported))
+            self._racers[racer_id] = target
+            try:
+                self._request(source, ("drop", racer_id))
+            except ShardError as e:
+                LOGGER.warning(f"Moved '{racer_id}' to {target} but could not drop it from {source}: {e}")
+
+    def add_worker(self) -> str:
+        """
+        Starts a worker and moves over the racers it now owns, roughly 1/N of them.
+        """
+        worker_id = f"worker-{self._next_worker}"
+        self._next_worker += 1
+        self._workers[worker_id] = _Worker(worker_id, self._context)
+        self.ring.add(worker_id)
+        moving = [racer_id for racer_id in self._racers if self.ring.get(racer_id) == worker_id]
+        self._migrate(moving)
+        LOGGER.info(f"Added {worker_id}, moved {len(moving)} of {len(self._racers)} racers")
+        return worker_id
+
+    def remove_worker(self, worker_id: str) -> int:
+        """
+        Moves the worker's racers to their new owners and stops it. Returns how many racers moved.
+        """
+        if worker_id not in self._workers:
+            raise ShardError(f"Unknown worker: {worker_id}")
+        if len(self._workers) == 1 and self._racers:
+            raise ShardError("Can not remove the last worker while it still owns racers")
+        self.ring.remove(worker_id)
+        moving = [racer_id for racer_id, owner in self._racers.items() if owner == worker_id]
+        try:
+            self._migrate(moving)
+        except ShardError:
+            # The racers that did not move are still on the worker, keep it in the ring
+            self.ring.add(worker_id)
+            raise
+        self._stop_worker(self._workers.pop(worker_id))
+        LOGGER.info(f"Removed {worker_id}, moved {len(moving)} racers")
+        return len(moving)
+
+    def _stop_worker(self, worker: _Worker, timeout: float = 5.0):
+        try:
+            worker.conn.send(("stop",))
+            if worker.conn.poll(timeout):
+                worker.conn.recv()
+        except (OSError, EOFError):
+            pass
+        worker.process.join(timeout)
+        if worker.process.is_alive():
+            worker.process.terminate()
+        worker.conn.close()
+
+    def register(
+            self, racer_id: str, racer_name: str, team_name: str, persona_variables: Optional[dict] = None,
+            spam_filter: bool = True, persona_overrides: Optional[dict] = None
+            ):
+        """
+        Creates the racer on the worker that owns its ID. With persona variables or overrides (bucket
+        to template list) the racer gets its own Persona, otherwise it shares the worker's generator.
+        """
+        worker_id = self.ring.get(racer_id)
+        self._request(
+            worker_id,
+            ("register", racer_id, racer_name, team_name, persona_variables, persona_overrides, spam_filter)
+        )
+        self._racers[racer_id] = worker_id
+
+    def call(self, racer_id: str, op: str, *args):
+        """
+        Runs one command e.g. call("go", "post", "MonzaGP") on the racer's worker and waits for it.
+        """
+        worker_id = self._racers.get(racer_id)
+        if worker_id is None:
+            raise ShardError(f"Racer '{racer_id}' is not registered")
+        return self._request(worker_id, (op, racer_id, *args))
+
+    def call_many(self, commands: list) -> list:
+        """
+        Runs (racer_id, op, *args) commands with every worker busy at the same time. Results come back
+        in the order of `commands`, a failed command logs an error and returns None. A worker that can
+        not be reached raises a ShardError.
+        """
+        results = [None] * len(commands)
+        pending = {worker_id: deque() for worker_id in self._workers}
+        for worker in self._workers.values():
+            worker.drain(self.timeout)
+
+        def collect(worker_id: str):
+            index = pending[worker_id].popleft()
+            ok, result = self._workers[worker_id].receive(self.timeout)
+            if ok:
+                results[index] = result
+            else:
+                LOGGER.error(f"Command {commands[index][:2]} failed on {worker_id}: {result}")
+
+        try:
+            for index, (racer_id, op, *args) in enumerate(commands):
+                worker_id = self._racers.get(racer_id)
+                if worker_id is None:
+                    LOGGER.error(f"Racer '{racer_id}' is not registered")
+                    continue
+                if len(pending[worker_id]) >= self.window:
+                    collect(worker_id)
+                self._workers[worker_id].send((op, racer_id, *args))
+                pending[worker_id].append(index)
+            for worker_id, queue in pending.items():
+                while queue:
+                    collect(worker_id)
+        finally:
+            # Responses still owed after a failure are skipped before the worker's next request
+            for worker_id, queue in pending.items():
+                self._workers[worker_id].stale += len(queue)
+        return results
+
+    def health_check(self, timeout: float = 1.0) -> dict:
+        """
+        Pings every worker. Returns per worker whether it is alive, its latency and how many racers it owns.
+        """
+        report = {}
+        for worker_id, worker in self._workers.items():
+            alive = worker.process.is_alive()
+            latency = None
+            racers = sum(1 for owner in self._racers.values() if owner == worker_id)
+            if alive:
+                start = time.perf_counter()
+                try:
+                    worker.drain(timeout)
+                    worker.send(("ping",))
+                    worker.receive(timeout)
+                    latency = time.perf_counter() - start
+                except ShardError:
+                    alive = False
+            report[worker_id] = {"alive": alive, "latency": latency, "racers": racers}
+            if not alive:
+                LOGGER.warning(f"Health check failed for {worker_id}")
+        return report
+
+    def close(self):
+        for worker in self._workers.values():
+            self._stop_worker(worker)
+        self._workers.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,300 @@
+"""
+Discrete-event simulation of a whole grid on social media. Racers and synthetic fans like, reply to,
+share and mention each other's posts over a follower graph, so interactions can cascade.
+"""
+import heapq
+import logging
+import math
+import random
+import time
+from array import array
+from collections import Counter
+from enum import Enum
+from typing import NamedTuple, Optional
+
+from agent.racer import Racer
+
+
+LOGGER = logging.getLogger(__name__)
+
+FAN_COMMENTS = (
+    "What a drive today!",
+    "Gutted about the result, the car looked quick",
+    "Why did the team pit so late?",
+    "Those tyres were finished after ten laps",
+    "Brilliant strategy call!",
+    "Hope you are ok after that crash",
+    "Rain is coming, are you ready?",
+    "Love the new livery",
+)
+
+
+class EventType(Enum):
+    POST = "post"
+    LIKE = "like"
+    REPLY = "reply"
+    SHARE = "share"
+    MENTION = "mention"
+
+    # Return a readable version for object deconstruction
+    def __str__(self):
+        return self.value
+
+
+class InteractionConfig(NamedTuple):
+    """
+    Probabilities are per follower who sees a post, unless noted otherwise. Times are in simulated
+    seconds.
+    """
+    like: float = 0.02
+    reply: float = 0.002
+    share: float = 0.001
+    # Chance a racer's post also mentions another racer
+    mention: float = 0.1
+    # Chance a racer answers a reply to their post, the answer is a post of its own. Every answer
+    # reaches all the racer's followers, keep it small or cascades grow without bound
+    racer_answer: float = 0.01
+    # Chance a mentioned racer posts in response
+    mention_response: float = 0.5
+    racer_post_interval: float = 900.0
+    fan_post_interval: float = 86400.0
+    reaction_delay: float = 60.0
+    # Shares, answers and mention responses deeper than this are not fanned out any further
+    max_depth: int = 6
+
+
+class FollowerGraph:
+    """
+    Who follows whom in compressed sparse row form: the followers of node n are
+    followers[offsets[n]:offsets[n + 1]]. Two flat arrays no matter how many nodes there are.
+    """
+    def __init__(self, offsets: array, followers: array):
+        self.offsets = offsets
+        self.followers = followers
+
+    @property
+    def nodes(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def edges(self) -> int:
+        return len(self.followers)
+
+    @property
+    def nbytes(self) -> int:
+        return self.offsets.itemsize * len(self.offsets) + self.followers.itemsize * len(self.followers)
+
+    def degree(self, node: int) -> int:
+        return self.offsets[node + 1] - self.offsets[node]
+
+    def followers_of(self, node: int) -> memoryview:
+        return memoryview(self.followers)[self.offsets[node]:self.offsets[node + 1]]
+
+    @classmethod
+    def from_edges(cls, nodes: int, followed: array, following: array) -> "FollowerGraph":
+        """
+        Builds the graph from parallel arrays of (followed node, follower node) edges with a counting
+        sort, so there is never a per-node list.
+        """
+        offsets = array("Q", bytes(8 * (nodes + 1)))
+        for node in followed:
+            offsets[node + 1] += 1
+        for node in range(nodes):
+            offsets[node + 1] += offsets[node]
+        followers = array("I", bytes(4 * len(followed)))
+        position = array("Q", offsets[:-1])
+        for node, follower in zip(followed, following):
+            followers[position[node]] = follower
+            position[node] += 1
+        return cls(offsets, followers)
+
+    @classmethod
+    def random(
+            cls, nodes: int, racers: int, follows_per_fan: int = 20, racer_share: float = 0.3,
+            seed: Optional[int] = None
+            ) -> "FollowerGraph":
+        """
+        A grid of `racers` (nodes 0 to racers - 1) who all follow each other, and fans who each follow
+        `follows_per_fan` nodes, a `racer_share` of them racers and the rest other fans.
+        """
+        rng = random.Random(seed)
+        followed, following = array("I"), array("I")
+        for racer in range(racers):
+            for other in range(racers):
+                if other != racer:
+                    followed.append(other)
+                    following.append(racer)
+        for fan in range(racers, nodes):
+            for _ in range(follows_per_fan):
+                if rng.random() < racer_share:
+                    target = rng.randrange(racers)
+                else:
+                    target = rng.randrange(racers, nodes)
+                if target != fan:
+                    followed.append(target)
+                    following.append(fan)
+        return cls.from_edges(nodes, followed, following)
+
+
+def _bernoulli_indexes(rng: random.Random, count: int, probability: float):
+    """
+    Indexes below `count` each picked with `probability`, found by jumping geometric gaps between
+    picks so the cost follows the number picked rather than `count`.
+    """
+    if probability <= 0:
+        return
+    if probability >= 1:
+        yield from range(count)
+        return
+    log_miss = math.log(1.0 - probability)
+    index = -1
+    while True:
+        index += int(math.log(1.0 - rng.random()) / log_miss) + 1
+        if index >= count:
+            return
+        yield index
+
+
+class SocialSimulation:
+    """
+    Priority queue event loop over a follower graph. The first len(racers) nodes are the racers, whose
+    posts, replies, likes and mentions go through their Racer (and so their ActionSimulator), every
+    other node is a synthetic fan.
+    """
+    def __init__(
+            self, graph: FollowerGraph, racers: list, config: InteractionConfig = InteractionConfig(),
+            race_name: str = "SilverstoneGP", seed: Optional[int] = None
+            ):
+        if len(racers) > graph.nodes:
+            raise ValueError(f"{len(racers)} racers do not fit in a graph of {graph.nodes} nodes")
+        self.graph = graph
+        self.racers: list = racers
+        self.config = config
+        self.race_name = race_name
+        self.rng = random.Random(seed)
+        self.now = 0.0
+        # (time, sequence, event type, actor node, post ID, cascade depth)
+        self._queue: list = []
+        self._sequence = 0
+        # Posts as parallel columns, fans' posts have no text
+        self.post_authors = array("I")
+        self.post_texts: list = []
+
+        self.stats: Counter = Counter()
+        self.processed = 0
+        self.peak_queue = 0
+        self.max_depth_seen = 0
+        self.elapsed = 0.0
+
+    def node_name(self, node: int) -> str:
+        return self.racers[node].state.racer_name if node < len(self.racers) else f"fan_{node}"
+
+    def schedule(self, at: float, event_type: EventType, actor: int, post_id: int = -1, depth: int = 0):
+        self._sequence += 1
+        heapq.heappush(self._queue, (at, self._sequence, event_type, actor, post_id, depth))
+        if len(self._queue) > self.peak_queue:
+            self.peak_queue = len(self._queue)
+
+    def schedule_posts(self, duration: float):
+        """
+        Schedules every node's own posts over `duration` simulated seconds, racers every
+        `racer_post_interval` and fans every `fan_post_interval` seconds on average.
+        """
+        for node in range(self.graph.nodes):
+            interval = self.config.racer_post_interval if node < len(self.racers) else self.config.fan_post_interval
+            at = self.rng.expovariate(1.0 / interval)
+            while at < duration:
+                self.schedule(at, EventType.POST, node)
+                at += self.rng.expovariate(1.0 / interval)
+
+    def _new_post(self, author: int, text: Optional[str]) -> int:
+        self.post_authors.append(author)
+        self.post_texts.append(text)
+        return len(self.post_authors) - 1
+
+    def _fan_out(self, post_id: int, source: int, depth: int):
+        """
+        Shows a post to the source's followers and schedules whatever reactions they have to it.
+        """
+        if depth > self.config.max_depth:
+            return
+        self.max_depth_seen = max(self.max_depth_seen, depth)
+        followers = self.graph.followers_of(source)
+        delay = self.config.reaction_delay
+        for event_type, probability in (
+                (EventType.LIKE, self.config.like),
+                (EventType.REPLY, self.config.reply),
+                (EventType.SHARE, self.config.share),
+                ):
+            for index in _bernoulli_indexes(self.rng, len(followers), probability):
+                self.schedule(self.now + self.rng.expovariate(1.0 / delay), event_type, followers[index], post_id, depth)
+
+    def _handle(self, event_type: EventType, actor: int, post_id: int, depth: int):
+        racer: Optional[Racer] = self.racers[actor] if actor < len(self.racers) else None
+        if event_type == EventType.POST:
+            text = racer.post_update(self.race_name) if racer else None
+            post_id = self._new_post(actor, text)
+            self._fan_out(post_id, actor, depth)
+            if (racer and len(self.racers) > 1 and depth < self.config.max_depth
+                    and self.rng.random() < self.config.mention):
+                other = self.rng.randrange(len(self.racers) - 1)
+                other += other >= actor
+                racer.mention(self.node_name(other), self.race_name)
+                self.schedule(self.now + self.rng.expovariate(1.0 / self.config.reaction_delay),
+                              EventType.MENTION, other, post_id, depth + 1)
+        elif event_type == EventType.LIKE:
+            if racer:
+                author = self.post_authors[post_id]
+                racer.like_post(self.post_texts[post_id] or "", self.node_name(author))
+        elif event_type == EventType.REPLY:
+            author = self.post_authors[post_id]
+            if racer:
+                comment = self.post_texts[post_id] or self.rng.choice(FAN_COMMENTS)
+                reply = racer.reply_to_fan(comment, self.race_name, self.node_name(author))
+            else:
+                reply = self.rng.choice(FAN_COMMENTS)
+            # A racer may answer a reply to their post, the answer reaches their followers too
+            if (author < len(self.racers) and author != actor and reply is not None
+                    and self.rng.random() < self.config.racer_answer):
+                answer = self.racers[author].reply_to_fan(reply, self.race_name, self.node_name(actor))
+                if answer is not None:
+                    self._fan_out(self._new_post(author, answer), author, depth + 1)
+        elif event_type == EventType.SHARE:
+            self._fan_out(post_id, actor, depth + 1)
+        elif event_type == EventType.MENTION:
+            if self.rng.random() < self.config.mention_response:
+                self.schedule(self.now + self.rng.expovariate(1.0 / self.config.reaction_delay),
+                              EventType.POST, actor, depth=depth)
+
+    def run(self, until: Optional[float] = None, max_events: Optional[int] = None) -> dict:
+        """
+        Processes events in time order until the queue is empty, simulated time passes `until` or
+        `max_events` have been processed. Returns the report.
+        """
+        start = time.perf_counter()
+        queue = self._queue
+        processed = 0
+        while queue and (max_events is None or processed < max_events):
+            if until is not None and queue[0][0] > until:
+                break
+            self.now, _, event_type, actor, post_id, depth = heapq.heappop(queue)
+            self._handle(event_type, actor, post_id, depth)
+            self.stats[event_type] += 1
+            processed += 1
+        self.processed += processed
+        self.elapsed += time.perf_counter() - start
+        LOGGER.info(f"Processed {processed} events up to {self.now:.0f}s simulated, {len(queue)} still queued")
+        return self.report()
+
+    def report(self) -> dict:
+        return {
+            "events": self.processed,
+            "events_per_second": round(self.processed / self.elapsed) if self.elapsed else 0,
+            "by_type": {str(event_type): count for event_type, count in self.stats.items()},
+            "posts": len(self.post_authors),
+            "simulated_seconds": round(self.now),
+            "queued": len(self._queue),
+            "peak_queue": self.peak_queue,
+            "max_depth": self.max_depth_seen,
+            "graph_bytes": self.graph.nbytes,
+        }
@@ -0,0 +1,186 @@
+"""
+Cheap spam/bot pre-filter for fan comments. Runs ahead of sentiment scoring so junk never pays for
+a full VADER pass or triggers a reply action.
+"""
+import logging
+import re
+import time
+from collections import OrderedDict, defaultdict, deque
+from enum import Enum
+from typing import NamedTuple, Optional
+
+
+LOGGER = logging.getLogger(__name__)
+
+# All patterns are compiled once at import, the filter itself only runs them. They run on the lower
+# cased comment, matching case sensitively is several times cheaper than re.IGNORECASE
+URL_PATTERN = re.compile(
+    r"(?:https?://|www\.)\S+|\b[\w-]+\.(?:com|net|org|io|ly|gg|xyz|ru|top|info|link|click)\b(?:/\S*)?"
+)
+# "free" on its own is everywhere on race weekends (free practice, free air), only free stuff is spam
+SPAM_PHRASE_PATTERN = re.compile(
+    r"\b(?:free\s+(?:crypto|coins?|giveaways?|gifts?|money|followers|nfts?|skins?)|giveaway|promo(?:tion)?"
+    r"|crypto|bitcoin|btc|nft|airdrop|follow\s+(?:me|back)|check\s+(?:my|out\s+my)|dm\s+me"
+    r"|click\s+(?:here|link)|subscribe|earn\s+\$?\d+|limited\s+offer)\b"
+)
+# Same character (emoji included) ten or more times in a row e.g. !!!!!!!!!!. Fans stretch cheers
+# like GOOOOOOOO or 🔥🔥🔥🔥🔥🔥 themselves, so shorter runs do not count
+REPEATED_CHAR_PATTERN = re.compile(r"(.)\1{9,}", re.DOTALL)
+# Short unit repeated back to back e.g. 🔥🚀🔥🚀🔥🚀🔥🚀🔥🚀
+REPEATED_UNIT_PATTERN = re.compile(r"(\S{2,4}?)\1{4,}")
+# Same word four or more times e.g. "go go go go"
+REPEATED_TOKEN_PATTERN = re.compile(r"\b(\w+)\b(?:\W+\1\b){3,}")
+# Words and runs of punctuation or emoji for the signature. Bare numbers are left out, bots append them
+# to dodge duplicate checks
+TOKEN_PATTERN = re.compile(r"[^\W\d]\w*|[^\w\s]+")
+# Letters and emoji carry meaning in a fan comment, digits and punctuation on their own do not. Removing
+# everything else and measuring what is left counts them without a Python call per character
+NOT_WORDLIKE_PATTERN = re.compile(r"[^\w\u2100-\U0010FFFF]|[\d_]")
+# Cheapest checks first, the filter stops once a comment scores enough to be dropped
+PATTERN_CHECKS = (
+    ("spam_phrase", SPAM_PHRASE_PATTERN),
+    ("repeated_chars", REPEATED_CHAR_PATTERN),
+    ("url", URL_PATTERN),
+    ("repeated_tokens", REPEATED_TOKEN_PATTERN),
+    ("repeated_chars", REPEATED_UNIT_PATTERN),
+)
+
+
+class FilterAction(Enum):
+    ALLOW = "allow"
+    DEPRIORITIZE = "deprioritize"
+    DROP = "drop"
+
+    # Return a readable version for object deconstruction
+    def __str__(self):
+        return self.value
+
+
+class FilterDecision(NamedTuple):
+    action: FilterAction
+    score: float
+    reasons: tuple
+
+
+class SpamFilter:
+    """
+    Scores a comment with a handful of cheap heuristics and decides whether it is worth replying to.
+    Comments scoring at or above `drop_threshold` are dropped, at or above `deprioritize_threshold`
+    they skip sentiment scoring and get a generic reply.
+    """
+    WEIGHTS = {
+        "url": 0.6,
+        "spam_phrase": 0.4,
+        "repeated_chars": 0.5,
+        "repeated_tokens": 0.5,
+        "low_letter_ratio": 0.6,
+        # Fans repeat short cheers too, so a duplicate alone is not enough to deprioritize
+        "duplicate_signature": 0.4,
+        "known_spam": 1.0,
+        "rate_limited": 0.6,
+    }
+
+    def __init__(
+            self, drop_threshold: float = 1.0, deprioritize_threshold: float = 0.5,
+            rate_limit: int = 5, rate_window: float = 60.0,
+            signature_size: int = 8, duplicate_threshold: int = 3, max_signatures: int = 10000
+            ):
+        self.drop_threshold = drop_threshold
+        self.deprioritize_threshold = deprioritize_threshold
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.signature_size = signature_size
+        self.duplicate_threshold = duplicate_threshold
+        self.max_signatures = max_signatures
+
+        # Bounded LRU of recently seen signatures and how often each was seen
+        self._signature_counts: OrderedDict = OrderedDict()
+        self._known_spam: set = set()
+        self._author_activity: dict = defaultdict(deque)
+        self.last_decision: Optional[FilterDecision] = None
+        self.stats = {action: 0 for action in FilterAction}
+        self.reason_counts: dict = defaultdict(int)
+
+    def signature(self, text: str) -> tuple:
+        """
+        Hashes the distinct words of the lower cased text and keeps the smallest hashes (a bottom-k
+        sketch), so copy-pasted comments with small edits usually end up with the same signature.
+        Words rather than character n-grams keep it to a handful of hashes per comment. Uses the
+        builtin string hash, so signatures are only comparable within one process.
+        """
+        return self._signature(text.lower())
+
+    def _signature(self, lowered: str) -> tuple:
+        return tuple(sorted(map(hash, set(TOKEN_PATTERN.findall(lowered))))[:self.signature_size])
+
+    def learn_spam(self, text: str):
+        """
+        Registers a known spam example, comments with the same signature are dropped outright.
+        """
+        self._known_spam.add(self.signature(text))
+
+    def _is_rate_limited(self, author: str, now: float) -> bool:
+        activity = self._author_activity[author]
+        activity.append(now)
+        while activity and now - activity[0] > self.rate_window:
+            activity.popleft()
+        return len(activity) > self.rate_limit
+
+    def _seen_signature(self, signature: tuple) -> int:
+        count = self._signature_counts.pop(signature, 0) + 1
+        self._signature_counts[signature] = count
+        if len(self._signature_counts) > self.max_signatures:
+            self._signature_counts.popitem(last=False)
+        return count
+
+    def check(self, comment: str, author: Optional[str] = None, now: Optional[float] = None) -> FilterDecision:
+        """
+        Returns the filter decision for a comment and records it in the stats. Comments without an
+        author skip the rate limit, they can not be told apart. Scoring stops once the comment would be
+        dropped, so the reasons of a dropped comment may not be complete.
+        """
+        now = time.monotonic() if now is None else now
+        lowered = comment.lower()
+        reasons = []
+        score = 0.0
+
+        # Every comment counts towards the author's rate, dropped or not
+        if author is not None and self._is_rate_limited(author, now):
+            reasons.append("rate_limited")
+            score += self.WEIGHTS["rate_limited"]
+        for reason, pattern in PATTERN_CHECKS:
+            if score >= self.drop_threshold:
+                break
+            if reason not in reasons and pattern.search(lowered):
+                reasons.append(reason)
+                score += self.WEIGHTS[reason]
+        if score < self.drop_threshold:
+            # Spaces are not counted on either side of the ratio
+            length = len(comment) - comment.count(" ")
+            if length >= 4 and len(NOT_WORDLIKE_PATTERN.sub("", comment)) / length < 0.3:
+                reasons.append("low_letter_ratio")
+                score += self.WEIGHTS["low_letter_ratio"]
+        # The signature costs the most, only worth it if the comment might not be dropped yet
+        if score < self.drop_threshold:
+            signature = self._signature(lowered)
+            if signature in self._known_spam:
+                reasons.append("known_spam")
+                score += self.WEIGHTS["known_spam"]
+            elif self._seen_signature(signature) >= self.duplicate_threshold:
+                reasons.append("duplicate_signature")
+                score += self.WEIGHTS["duplicate_signature"]
+
+        if score >= self.drop_threshold:
+            action = FilterAction.DROP
+        elif score >= self.deprioritize_threshold:
+            action = FilterAction.DEPRIORITIZE
+        else:
+            action = FilterAction.ALLOW
+
+        decision = FilterDecision(action, round(score, 2), tuple(reasons))
+        self.last_decision = decision
+        self.stats[action] += 1
+        for reason in reasons:
+            self.reason_counts[reason] += 1
+        LOGGER.debug(f"Spam filter: {action} (score {decision.score}, reasons {reasons}) for {author}: '{comment}'")
+        return decision
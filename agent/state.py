@@ -4,6 +4,8 @@ Maintain the agent's state
 import logging
 from typing import Optional
 
+from agent.history import RaceHistory
+from agent.mood import MoodTracker
 from project.const import Stage, Result
 
 
@@ -12,33 +14,57 @@ LOGGER = logging.getLogger(__name__)
 class AgentState:
     """
     Manages the agent's contextual awareness. For a multi-dimensional character, this where 
-    entities like mood team morale could be defined
+    entities like mood team morale could be defined. Fan mood is tracked from reply sentiment.
     """
-    def __init__(self, racer_name: str, team_name: str, current_stage: Stage = Stage.FP1):
+    def __init__(
+            self, racer_name: str, team_name: str, current_stage: Stage = Stage.FP1,
+            fuzzy_parsing: bool = False
+            ):
         self.current_stage: Stage = current_stage
         self.last_result: Optional[Result] = None
+        # How sure the parser was about the last result, below 1 means it was a fuzzy match
+        self.last_result_confidence: Optional[float] = None
+        # Same for the current stage
+        self.stage_confidence: float = 1.0
+        self.fuzzy_parsing: bool = fuzzy_parsing
         self.team_name: str = team_name
         self.racer_name: str = racer_name
+        self.fan_mood: MoodTracker = MoodTracker()
+        self.history: RaceHistory = RaceHistory()
 
-    def update_stage(self, new_stage: Stage):
+    def update_stage(self, new_stage: Stage, confidence: float = 1.0):
         """
-        Updates the agent's current stage.
+        Updates the agent's current stage. `confidence` is below 1 when the stage was a fuzzy match.
         """
         self.current_stage = new_stage
+        self.stage_confidence = confidence
         LOGGER.debug(f"Agent context updated: Current stage is now {new_stage.value} ({new_stage.name})")
 
-    def record_result(self, result: str):
+    def record_result(self, result: str, race_name: Optional[str] = None):
         """
-        Records the race result after parsing it.
+        Records the race result after parsing it, and adds it to the season history for the
+        current stage of `race_name` (the last race seen if not given). Only a named race's result
+        replaces the previous one for the same stage.
         """
-        parsed_result = Result.from_string(result)
-        if parsed_result:
-            self.last_result = parsed_result
-            LOGGER.debug(f"Race result recorded: {self.last_result}")
+        match = Result.match_string(result, fuzzy=self.fuzzy_parsing)
+        if match:
+            self.last_result = match.value
+            self.last_result_confidence = match.confidence
+            self.history.record(self.current_stage, match.value, race_name)
+            LOGGER.debug(f"Race result recorded: {self.last_result} (confidence {match.confidence})")
         else:
             # Warn the user if the result is not updated. Optionally raise an error
             LOGGER.warning(f"Could not parse race result: '{result}'. Result not updated.")
 
+    def record_fan_sentiment(self, compound_score: Optional[float]):
+        """
+        Folds a fan comment's sentiment into the running fan mood. Missing scores are ignored.
+        """
+        if compound_score is None:
+            return
+        self.fan_mood.update(compound_score)
+        LOGGER.debug(f"Fan mood updated: {self.fan_mood.snapshot()}")
+
     def get_context(self):
         """
         Return current context.
@@ -48,4 +74,7 @@ class AgentState:
             "result": self.last_result,
             "team_name": self.team_name,
             "racer_name": self.racer_name,
+            "mood": self.fan_mood.tone(),
+            "fan_mood": self.fan_mood.snapshot(),
+            "form": self.history.form(),
         }
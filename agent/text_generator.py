@@ -5,7 +5,15 @@ import logging
 import random
 import os
 from abc import ABC, abstractmethod
+from collections import ChainMap
+from collections.abc import Mapping
+from typing import Optional
 
+from agent.archive import PostArchive
+from agent.history import ordinal_word
+from agent.persona import DEFAULT_PERSONA, Persona
+from agent.spam_filter import FilterAction
+from agent.topics import detect_topic
 from agent.utils import sentiment_analysis
 from project.const import Stage, TEMPLATES, Result
 
@@ -26,13 +34,61 @@ class TextGenerator(ABC):
     def generate_mention_post(self, context: dict, entity_to_mention: str, base_message: str) -> str:
         pass
 
+    def generate_mention_posts(
+            self, context: dict, entities: list, base_message: str, merge: bool = False, max_length: int = 280
+            ) -> list:
+        """
+        Returns (entities, text) pairs for a shout-out to many entities. Generators that can share work
+        between entities should override this, by default every entity gets its own post.
+        """
+        return [([entity], self.generate_mention_post(context, entity, base_message)) for entity in entities]
+
 
 class TemplateBasedTextGenerator(TextGenerator):
     """
     Generates text using predefined templates and racer vocabulary. Uses a sentiment analysis for replies
     """
-    def __init__(self):
-        self.templates = TEMPLATES
+    def __init__(
+            self, templates: Optional[Mapping] = None, persona: Optional[Persona] = None,
+            archive: Optional[PostArchive] = None, fresh_attempts: int = 8
+            ):
+        # Any bucket name to template list mapping works e.g. a TemplateStore over a corpus file.
+        # The base corpus is shared, a persona only layers its overridden buckets on top
+        base_templates = TEMPLATES if templates is None else templates
+        self.persona = persona or DEFAULT_PERSONA
+        self.templates = ChainMap(self.persona.overrides, base_templates) if self.persona.overrides else base_templates
+        # Recent posts in the archive are checked so the same text is not posted twice in a row
+        self.archive = archive
+        # Random templates tried per post before settling for the least similar one
+        self.fresh_attempts = fresh_attempts
+
+    def _render(self, template: str, **values) -> str:
+        """
+        Fills in the persona variables along with the context values.
+        """
+        return template.format_map({**self.persona.variables, **values})
+
+    def _render_fresh(self, template_list: list, context: dict, prefix: str = "", suffix: str = "", **values) -> str:
+        """
+        Renders a random template from the list between `prefix` and `suffix`. With an archive, up to
+        `fresh_attempts` random templates are tried until the whole text does not nearly repeat a recent
+        post by this racer, if they all do the one least like any recent post is used. The cost does not
+        depend on the size of the bucket.
+        """
+        if self.archive is None:
+            return prefix + self._render(random.choice(template_list), **values) + suffix
+        racer_name = context.get("racer_name")
+        best, best_score = None, None
+        # Sampling k distinct templates only touches k entries of a large bucket
+        for template in random.sample(template_list, min(self.fresh_attempts, len(template_list))):
+            text = prefix + self._render(template, **values) + suffix
+            _, score = self.archive.nearest(text, racer_name)
+            if score < self.archive.threshold:
+                return text
+            if best_score is None or score < best_score:
+                best, best_score = text, score
+        LOGGER.debug("Every template tried nearly repeats a recent post, using the least similar one")
+        return best
 
     def _get_race_name_placeholder(self, context: dict):
         return context.get("race_name", "SilverstoneGP")
@@ -40,6 +96,17 @@ class TemplateBasedTextGenerator(TextGenerator):
     def _get_stage_abbr(self, stage: Stage):
         return stage.short_name
 
+    def _get_template_list(self, key: str, context: dict, default_key: str) -> list:
+        """
+        Prefers the bucket tuned to the current fan mood e.g. win_tense, then the plain bucket.
+        """
+        mood = context.get("mood")
+        if mood:
+            template_list = self.templates.get(f"{key}_{mood}")
+            if template_list:
+                return template_list
+        return self.templates.get(key, self.templates[default_key])
+
     def generate_post(self, context: dict) -> str:
         stage = context.get("stage", Stage.FP1)
         result: Result | None = context.get("result")
@@ -90,48 +157,131 @@ class TemplateBasedTextGenerator(TextGenerator):
         else:
             key = "practice_1"
         LOGGER.debug(f"Calling template - {key}")
-        template_list = self.templates.get(key, self.templates["practice_1"])
-        chosen_template = random.choice(template_list)
+        template_list = self._get_template_list(key, context, "practice_1")
         
         # Inject context using string formating
-        return chosen_template.format(
-            team_name=team_name,
-            race_name=race_name,
-            stage=stage.value,
-            stage_abbr=stage_abbr,
-            result_detail=result_detail_for_quali
+        values = {
+            "team_name": team_name,
+            "race_name": race_name,
+            "stage": stage.value,
+            "stage_abbr": stage_abbr,
+            "result_detail": result_detail_for_quali,
+        }
+        # The form note is part of the post, so it is included in the near duplicate check
+        form_note = self._get_form_note(stage, context.get("form"), values)
+        return self._render_fresh(template_list, context, suffix=f" {form_note}" if form_note else "", **values)
+
+    def _get_form_note(self, stage: Stage, form: Optional[dict], values: dict) -> str:
+        """
+        A line about streaks or season bests from the history aggregates, empty if there is nothing
+        worth adding or the corpus has no form templates.
+        """
+        if not form:
+            return ""
+        key, streak = None, 0
+        if stage == Stage.RACE:
+            if form["win_streak"] >= 2:
+                key, streak = "form_win_streak", form["win_streak"]
+            elif form["podium_streak"] >= 2:
+                key, streak = "form_podium_streak", form["podium_streak"]
+        elif stage in [Stage.Q1, Stage.Q2, Stage.Q3] and form["new_best_qualifying"]:
+            key = "form_best_qualifying"
+        template_list = self.templates.get(key) if key else None
+        if not template_list:
+            return ""
+        return self._render(
+            random.choice(template_list), **values, streak=streak, streak_ordinal=ordinal_word(streak)
         )
 
     def generate_reply(self, context: dict, original_comment: str) -> str:
         racer_name = context.get("racer_name", "I")
-        compound_score = sentiment_analysis(original_comment)
+        team_name = context.get("team_name", "Mach 5")
+        race_name = self._get_race_name_placeholder(context)
+        # Likely junk gets a generic reply without paying for sentiment scoring
+        if context.get("filter_action") == FilterAction.DEPRIORITIZE:
+            return f"{racer_name} replies: {self._render(random.choice(self.templates['reply_neutral']), team_name=team_name, race_name=race_name)}"
+        # The Racer may have scored the comment already
+        if "comment_sentiment" in context:
+            compound_score = context["comment_sentiment"]
+        else:
+            compound_score = sentiment_analysis(original_comment)
 
         LOGGER.debug(f"Fan comment: '{original_comment}', Sentiment (compound): {compound_score}")
 
-        if compound_score >= 0.05:
-            reply_list = self.templates["reply_positive"]
-        elif compound_score <= -0.05:
-            reply_list = self.templates["reply_negative"]
-        elif compound_score is None:
+        if compound_score is None:
             # Fallback if NLTK/VADER is not available
-            reply_list = self.templates["reply_neutral"]
+            key = "reply_neutral"
+        elif compound_score >= 0.05:
+            key = "reply_positive"
+        elif compound_score <= -0.05:
+            key = "reply_negative"
         else:
-            reply_list = self.templates["reply_neutral"]
-    
+            key = "reply_neutral"
 
-        return f"{racer_name} replies: {random.choice(reply_list)}"
+        # A comment about tyres, strategy etc. gets a reply on that topic if there are templates for it
+        topic = context["comment_topic"] if "comment_topic" in context else detect_topic(original_comment)
+        reply_list = self.templates.get(f"reply_{topic}_{key[len('reply_'):]}") if topic else None
+        if reply_list:
+            LOGGER.debug(f"Fan comment topic: {topic}")
+        else:
+            reply_list = self._get_template_list(key, context, "reply_neutral")
 
-    def generate_mention_post(self, context: dict, entity_to_mention: str, base_message: str) -> str:
+        return self._render_fresh(
+            reply_list, context, prefix=f"{racer_name} replies: ", team_name=team_name, race_name=race_name
+        )
+
+    def _get_mention_parts(self, context: dict, base_message: str) -> tuple:
+        """
+        Everything in a mention post that does not depend on the entity, the text before and after it.
+        """
         compound_score = sentiment_analysis(base_message)
-        if compound_score >= 0.05:
-            message = f"{base_message}, Big shoutout to @{entity_to_mention}!"
-        elif compound_score <= -0.05:
-            message = f"{base_message} But still a huge shoutout to @{entity_to_mention}!"
+        if compound_score is not None and compound_score >= 0.05:
+            prefix = f"{base_message}, Big shoutout to "
+        elif compound_score is not None and compound_score <= -0.05:
+            prefix = f"{base_message} But still a huge shoutout to "
         else:
             # Fallback if NLTK/VADER is not available or neutral
-            message = f"{base_message} Shoutout to @{entity_to_mention}!"
-        
+            prefix = f"{base_message} Shoutout to "
+
+        suffix = "!"
         if context["stage"] == Stage.RACE and context["result"] == Result.P1:
-            message += f" #Team{context['team_name']} #Winner"
+            suffix += f" #Team{context['team_name']} #Winner"
+
+        return prefix, suffix
+
+    def generate_mention_post(self, context: dict, entity_to_mention: str, base_message: str) -> str:
+        prefix, suffix = self._get_mention_parts(context, base_message)
+        return f"{prefix}@{entity_to_mention}{suffix}"
+
+    def generate_mention_posts(
+            self, context: dict, entities: list, base_message: str, merge: bool = False, max_length: int = 280
+            ) -> list:
+        """
+        Scores the message and works out the hashtags once for all entities. With `merge` entities are
+        packed into as few posts as fit in `max_length` characters, an entity that does not fit even on
+        its own is skipped.
+        """
+        prefix, suffix = self._get_mention_parts(context, base_message)
+        if not merge:
+            return [([entity], f"{prefix}@{entity}{suffix}") for entity in entities]
 
-        return message
+        posts = []
+        batch = []
+        length = len(prefix) + len(suffix)
+        for entity in entities:
+            mention = f"@{entity}"
+            if len(prefix) + len(mention) + len(suffix) > max_length:
+                LOGGER.warning(f"Skipping mention of {entity}, the post would be longer than {max_length} characters")
+                continue
+            # Mentions are separated by a space, the first one is not
+            added = len(mention) + (1 if batch else 0)
+            if batch and length + added > max_length:
+                posts.append((batch, f"{prefix}{' '.join(f'@{e}' for e in batch)}{suffix}"))
+                batch = []
+                length = len(prefix) + len(suffix)
+                added = len(mention)
+            batch.append(entity)
+            length += added
+        if batch:
+            posts.append((batch, f"{prefix}{' '.join(f'@{e}' for e in batch)}{suffix}"))
+        return posts
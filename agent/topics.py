@@ -0,0 +1,99 @@
+"""
+Racing topic detection for fan comments. Every topic's keywords and phrases are folded into one
+token index at import, so a comment is scanned once no matter how many topics there are.
+"""
+import re
+from collections import Counter
+from enum import Enum
+from typing import Optional
+
+
+class Topic(Enum):
+    TYRES = "tyres"
+    PIT_STOP = "pit_stop"
+    STRATEGY = "strategy"
+    WEATHER = "weather"
+    CRASH = "crash"
+
+    # Return a readable version for object deconstruction
+    def __str__(self):
+        return self.value
+
+
+# Keywords and phrases per topic, matched on whole words and case insensitive. Plurals and simple
+# variants are spelled out so matching stays a plain lookup
+TOPIC_KEYWORDS = {
+    Topic.TYRES: (
+        "tyre", "tyres", "tire", "tires", "rubber", "compound", "compounds", "softs", "mediums", "hards",
+        "inters", "intermediates", "full wets", "graining", "blistering", "deg", "degradation", "tyre wear",
+        "flat spot", "puncture",
+    ),
+    Topic.PIT_STOP: (
+        "pit", "pits", "pitted", "pitting", "pit stop", "pit stops", "pitstop", "pitstops", "box box",
+        "pit crew", "pit lane", "pitlane", "wheel gun", "double stack", "stationary",
+    ),
+    Topic.STRATEGY: (
+        "strategy", "strategies", "strategist", "undercut", "overcut", "one stop", "two stop", "one-stop",
+        "two-stop", "stint", "stints", "plan b", "team orders", "gamble", "tactics",
+        "fuel saving", "lift and coast",
+    ),
+    Topic.WEATHER: (
+        "rain", "raining", "rainy", "wet", "weather", "drizzle", "storm", "sunny", "heat", "cold", "wind",
+        "windy", "track temp", "track temperature", "forecast", "spray",
+    ),
+    Topic.CRASH: (
+        "crash", "crashed", "crashes", "collision", "contact", "shunt", "wreck", "barrier", "spin", "spun",
+        "incident", "red flag", "safety car", "vsc", "damage", "off track",
+    ),
+}
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _build_index(topic_keywords: dict) -> dict:
+    """
+    First token of every keyword -> (remaining tokens, topic) pairs, longest first so "pit stop"
+    wins over "pit". "one-stop" and "one stop" both become ("one", "stop").
+    """
+    index = {}
+    for topic, keywords in topic_keywords.items():
+        for keyword in keywords:
+            tokens = tuple(TOKEN_PATTERN.findall(keyword.lower()))
+            index.setdefault(tokens[0], []).append((tokens[1:], topic))
+    return {token: tuple(sorted(entries, key=lambda entry: len(entry[0]), reverse=True)) for token, entries in index.items()}
+
+
+KEYWORD_INDEX = _build_index(TOPIC_KEYWORDS)
+
+
+def topic_counts(text: str) -> Counter:
+    """
+    How many keyword hits every topic has in the text. One pass over the tokens, each token costs a
+    dict lookup and only tokens starting a keyword look further ahead.
+    """
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    counts = Counter()
+    i = 0
+    while i < len(tokens):
+        entries = KEYWORD_INDEX.get(tokens[i])
+        i += 1
+        if entries is None:
+            continue
+        for rest, topic in entries:
+            if not rest or tuple(tokens[i:i + len(rest)]) == rest:
+                counts[topic] += 1
+                i += len(rest)
+                break
+    return counts
+
+
+def detect_topic(text: str) -> Optional[Topic]:
+    """
+    The topic with the most hits, ties go to the one mentioned first. None if no topic is mentioned.
+    """
+    counts = topic_counts(text)
+    if not counts:
+        return None
+    # Counter keeps insertion order and max returns the first of equal counts
+    return max(counts, key=counts.__getitem__)
@@ -0,0 +1,4 @@
+"""
+Offline benchmarks and evaluation commands. Run from the project root e.g.
+python -m benchmarks.spam_filter_eval
+"""
@@ -0,0 +1,60 @@
+"""
+Near-duplicate lookup cost of the post archive as the recent window grows, compared with comparing
+against every post in the window.
+"""
+import argparse
+import random
+import time
+
+from agent.archive import PostArchive
+from agent.text_generator import TemplateBasedTextGenerator
+from project.const import Result, Stage
+
+
+def make_posts(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    random.seed(seed)
+    generator = TemplateBasedTextGenerator()
+    stages = list(Stage)
+    results = [Result.P1, Result.P3, Result.P8, Result.P15, Result.DNF, None]
+    return [
+        generator.generate_post({
+            "stage": rng.choice(stages), "result": rng.choice(results), "team_name": f"Team{rng.randrange(10)}",
+            "race_name": f"Race{rng.randrange(500)}GP",
+        })
+        for _ in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark near-duplicate lookups in the post archive.")
+    parser.add_argument("--windows", type=int, nargs="+", default=[256, 4096, 32768])
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    posts = make_posts(max(args.windows) + args.lookups, args.seed)
+    for window in args.windows:
+        archive = PostArchive(window=window)
+        for text in posts[:window]:
+            archive.record("post", text)
+        queries = posts[window:window + args.lookups]
+
+        start = time.perf_counter()
+        duplicates = sum(archive.is_near_duplicate(text) for text in queries)
+        indexed = (time.perf_counter() - start) / len(queries) * 1e6
+
+        # Every query compared with every sketch in the window
+        sketches = list(archive._recent.values())
+        start = time.perf_counter()
+        for text in queries[:200]:
+            sketch = archive.sketch(text)
+            max(archive.similarity(sketch, other) for other in sketches)
+        linear = (time.perf_counter() - start) / min(len(queries), 200) * 1e6
+
+        print(f"window {window:>6}: band index {indexed:>9.1f} us/lookup, full scan {linear:>10.1f} us/lookup, "
+              f"{duplicates / len(queries):.0%} near duplicates")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Memory and render cost of many personas. Compares persona overlays on the shared base templates
+with giving every persona its own full copy of the templates.
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from agent.persona import Persona
+from agent.text_generator import TemplateBasedTextGenerator
+from project.const import Result, Stage, TEMPLATES
+
+
+def make_persona(i: int) -> Persona:
+    overrides = {}
+    # Roughly one in ten personas brings its own celebration lines
+    if i % 10 == 0:
+        overrides["win"] = [f"Racer {i} takes the win at #{{race_name}}! The {{car_name}} was perfect. {{signature_hashtag}}"]
+    return Persona(
+        f"Racer {i}",
+        variables={"car_name": f"Car {i}", "car_tag": f"Car{i}", "signature_hashtag": f"#GoRacer{i}"},
+        overrides=overrides,
+    )
+
+
+def full_copy(i: int) -> dict:
+    """
+    What a persona costs without overlays, every template rewritten with the persona's names.
+    """
+    variables = {"car_name": f"Car {i}", "car_tag": f"Car{i}", "signature_hashtag": f"#GoRacer{i}"}
+    return {
+        bucket: [
+            template.replace("{car_name}", variables["car_name"])
+            .replace("{car_tag}", variables["car_tag"])
+            .replace("{signature_hashtag}", variables["signature_hashtag"])
+            for template in template_list
+        ]
+        for bucket, template_list in TEMPLATES.items()
+    }
+
+
+def measure(build, count: int) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    objects = [build(i) for i in range(count)]
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objects, current, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark persona overlays.")
+    parser.add_argument("--personas", type=int, default=5000)
+    parser.add_argument("--renders", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    # Warm up so one-off allocations are not counted against the personas
+    measure(lambda i: TemplateBasedTextGenerator(persona=make_persona(i)), 10)
+    generators, overlay_bytes, overlay_seconds = measure(
+        lambda i: TemplateBasedTextGenerator(persona=make_persona(i)), args.personas
+    )
+    print(f"Overlays:    {args.personas} personas, {overlay_bytes / 1024 ** 2:.2f} MiB "
+          f"({overlay_bytes / args.personas:,.0f} B/persona), built in {overlay_seconds:.3f}s")
+
+    copies, copy_bytes, copy_seconds = measure(full_copy, args.personas)
+    print(f"Full copies: {args.personas} personas, {copy_bytes / 1024 ** 2:.2f} MiB "
+          f"({copy_bytes / args.personas:,.0f} B/persona), built in {copy_seconds:.3f}s")
+    del copies
+
+    rng = random.Random(args.seed)
+    stages = list(Stage)
+    results = [Result.P1, Result.P2, Result.P9, Result.DNF, None]
+    contexts = [
+        {"stage": rng.choice(stages), "result": rng.choice(results), "team_name": "Team", "race_name": "MonzaGP"}
+        for _ in range(256)
+    ]
+    start = time.perf_counter()
+    for i in range(args.renders):
+        generators[i % len(generators)].generate_post(contexts[i % len(contexts)])
+    elapsed = time.perf_counter() - start
+    print(f"Rendering:   {args.renders / elapsed:,.0f} posts/s across {len(generators)} personas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Aggregate command throughput of the sharded runtime as the number of workers grows, plus how many
+racers move when a worker is added or removed.
+"""
+import argparse
+import os
+import random
+import time
+
+from agent.sharding import ShardedRuntime
+
+
+COMMENTS = [
+    "What a drive today!",
+    "Gutted about the result, the car looked quick",
+    "Why did the team pit so late?",
+    "Love the new livery",
+]
+STAGES = ["fp1", "fp2", "fp3", "q1", "q2", "q3", "race"]
+RESULTS = ["P1", "P3", "P8", "P15", "DNF"]
+
+
+def make_commands(racer_ids: list, count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    commands = []
+    for _ in range(count):
+        racer_id = rng.choice(racer_ids)
+        roll = rng.random()
+        if roll < 0.4:
+            commands.append((racer_id, "post", "MonzaGP"))
+        elif roll < 0.8:
+            commands.append((racer_id, "reply", rng.choice(COMMENTS), "MonzaGP", f"fan_{rng.randrange(10000)}"))
+        elif roll < 0.9:
+            commands.append((racer_id, "stage", rng.choice(STAGES)))
+        else:
+            commands.append((racer_id, "result", rng.choice(RESULTS)))
+    return commands
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the sharded racer runtime.")
+    parser.add_argument("--racers", type=int, default=1000)
+    parser.add_argument("--commands", type=int, default=20000)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1}),
+        help="Worker counts to benchmark."
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    racer_ids = [f"racer-{i}" for i in range(args.racers)]
+    commands = make_commands(racer_ids, args.commands, args.seed)
+    print(f"{args.racers} racers, {args.commands} commands, {os.cpu_count()} CPUs")
+
+    for workers in args.workers:
+        with ShardedRuntime(workers=workers) as runtime:
+            for racer_id in racer_ids:
+                # No spam filter so every worker count does the same amount of work
+                runtime.register(racer_id, racer_id, "Team", spam_filter=False)
+            runtime.call_many(commands[:500])  # Warm up
+
+            start = time.perf_counter()
+            runtime.call_many(commands)
+            elapsed = time.perf_counter() - start
+
+            health = runtime.health_check()
+            spread = ", ".join(str(report["racers"]) for report in health.values())
+            print(f"  {workers} workers: {args.commands / elapsed:>10,.0f} commands/s  (racers per worker: {spread})")
+
+            added = runtime.add_worker()
+            moved_add = runtime.health_check()[added]["racers"]
+            moved_remove = runtime.remove_worker(added)
+            print(f"             adding a worker moved {moved_add} racers, removing it moved {moved_remove}"
+                  f" (ideal {args.racers / (workers + 1):.0f})")
+
+
+if __name__ == "__main__":
+    main()
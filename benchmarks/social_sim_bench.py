@@ -0,0 +1,59 @@
+"""
+Event throughput and memory of the social simulation on a large follower graph.
+"""
+import argparse
+import random
+import resource
+import time
+
+from agent.persona import Persona
+from agent.racer import Racer
+from agent.simulation import FollowerGraph, InteractionConfig, SocialSimulation
+from agent.text_generator import TemplateBasedTextGenerator
+from project.const import Stage
+
+
+def make_grid(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    racers = []
+    for i in range(count):
+        persona = Persona(f"Racer {i}", {"car_name": f"Car {i}", "car_tag": f"Car{i}", "signature_hashtag": f"#GoRacer{i}"})
+        racer = Racer(TemplateBasedTextGenerator(persona=persona), persona.name, f"Team{i // 2}")
+        racer.update_context_stage(Stage.RACE)
+        racer.record_race_result(rng.choice(["P1", "P2", "P5", "P9", "P14", "DNF"]), "SilverstoneGP")
+        racers.append(racer)
+    return racers
+
+
+def max_rss_mib() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the multi-agent social simulation.")
+    parser.add_argument("--nodes", type=int, default=100000)
+    parser.add_argument("--racers", type=int, default=20)
+    parser.add_argument("--follows", type=int, default=20, help="Nodes every fan follows.")
+    parser.add_argument("--duration", type=float, default=3600.0, help="Simulated seconds of posts.")
+    parser.add_argument("--max-events", type=int, default=1000000, help="Stop after this many events, cascades can run long.")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rss_before = max_rss_mib()
+    start = time.perf_counter()
+    graph = FollowerGraph.random(args.nodes, args.racers, args.follows, seed=args.seed)
+    print(f"Graph:      {graph.nodes:,} nodes, {graph.edges:,} edges, {graph.nbytes / 1024 ** 2:.1f} MiB of arrays, "
+          f"built in {time.perf_counter() - start:.1f}s")
+
+    simulation = SocialSimulation(graph, make_grid(args.racers, args.seed), InteractionConfig(), seed=args.seed)
+    simulation.schedule_posts(args.duration)
+    report = simulation.run(max_events=args.max_events)
+    print(f"Events:     {report['events']:,} in {simulation.elapsed:.1f}s, {report['events_per_second']:,} events/s")
+    print(f"            {', '.join(f'{event_type}: {count:,}' for event_type, count in report['by_type'].items())}")
+    print(f"Cascades:   {report['posts']:,} posts, peak queue {report['peak_queue']:,}, max depth {report['max_depth']}")
+    print(f"Memory:     peak RSS {max_rss_mib():.0f} MiB ({max_rss_mib() - rss_before:.0f} MiB above start)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Offline evaluation of the spam pre-filter. Reports precision, recall and throughput on a labelled
+dataset, a TSV file with `label<TAB>author<TAB>comment` rows where label is spam or ham, next to the
+cost of the VADER pass the filter saves. Without a dataset a synthetic race-day comment stream is
+generated.
+"""
+import argparse
+import random
+import time
+
+from agent.spam_filter import FilterAction, SpamFilter
+from agent.utils import SENTIMENT_ANALYZER, sentiment_analysis
+
+
+HAM_COMMENTS = [
+    "What a drive today Go, you were unbelievable in the last stint!",
+    "Gutted about the DNF, the car looked so quick before the stop",
+    "That overtake into turn 1 was insane",
+    "Why did the team leave you out so long on those tyres?",
+    "Proud of you, see you at the next race",
+    "Strategy call was a bit questionable but great recovery",
+    "The pit crew were lightning fast today",
+    "Rain is coming for qualifying, hope the setup works",
+    "Love the new livery on the Mach 5",
+    "Unlucky with that safety car timing",
+    "P2 is still a massive result, keep pushing",
+    "Can't wait for the home race next week!",
+    # "Free" is part of the race weekend, not only of giveaways
+    "Good luck in free practice tomorrow!",
+    "Free practice 2 long runs looked really strong",
+    "Quiet free practice but the car is in a good window",
+    # Race-day cheers stretch letters and stack emoji but are not spam
+    "GOOOOOOOO MACH 5!!!!!!",
+    "P1!!! 🔥🔥🔥🔥🔥🔥",
+    "YESSSSSS 🏆🏆🏆",
+    "LIGHTS OUT AND AWAY WE GO 🏎️🏎️🏎️",
+]
+# Fans rarely post the exact same sentence, these get mixed into the comments above
+HAM_OPENERS = ["", "Honestly, ", "Go, ", "Mate, ", "Wow. ", "From Japan: ", "Watching live! "]
+HAM_CLOSERS = ["", " 🏎️", " See you in Monza.", " Keep it up!", " #F1", " Big fan since 2019.", " 💙"]
+SPAM_COMMENTS = [
+    "FREE crypto giveaway!!! click here https://bit.ly/f1-free-coins",
+    "🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥",
+    "follow me for daily F1 edits www.f1edits.xyz",
+    "Earn $500 a day from home, DM me",
+    "🚀🏎️🚀🏎️🚀🏎️🚀🏎️🚀🏎️🚀🏎️",
+    "check my page for the best promo codes f1promo.com",
+    "go go go go go go go go",
+    "!!!!!!!!!!!!!!!!",
+    "subscribe to my channel for race highlights youtube.com/watch?v=abc",
+    "NFT airdrop for F1 fans, limited offer",
+]
+
+
+def synthetic_dataset(size: int, spam_ratio: float, seed: int) -> list:
+    """
+    Builds a comment stream where a few bot accounts post most of the spam and fans post the rest.
+    """
+    rng = random.Random(seed)
+    bots = [f"bot_{i}" for i in range(5)]
+    fans = [f"fan_{i}" for i in range(max(size // 4, 1))]
+    rows = []
+    for _ in range(size):
+        if rng.random() < spam_ratio:
+            comment = rng.choice(SPAM_COMMENTS)
+            # Bots tweak the message a little to dodge exact duplicate checks
+            if rng.random() < 0.5:
+                comment = f"{comment} {rng.randint(1, 99)}"
+            rows.append((True, rng.choice(bots), comment))
+        else:
+            comment = f"{rng.choice(HAM_OPENERS)}{rng.choice(HAM_COMMENTS)}{rng.choice(HAM_CLOSERS)}"
+            rows.append((False, rng.choice(fans), comment))
+    return rows
+
+
+def load_dataset(path: str) -> list:
+    rows = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip() or line.startswith("#"):
+                continue
+            label, author, comment = line.rstrip("\n").split("\t", 2)
+            rows.append((label.strip().lower() == "spam", author, comment))
+    return rows
+
+
+def evaluate(rows: list, spam_filter: SpamFilter, interval: float, positive: set) -> dict:
+    """
+    Runs every row through the filter, comments arrive `interval` seconds apart.
+    """
+    true_positive = false_positive = false_negative = 0
+    start = time.perf_counter()
+    for i, (is_spam, author, comment) in enumerate(rows):
+        decision = spam_filter.check(comment, author, now=i * interval)
+        flagged = decision.action in positive
+        if flagged and is_spam:
+            true_positive += 1
+        elif flagged:
+            false_positive += 1
+        elif is_spam:
+            false_negative += 1
+    elapsed = time.perf_counter() - start
+
+    return {
+        "comments": len(rows),
+        "precision": true_positive / (true_positive + false_positive) if true_positive + false_positive else 0.0,
+        "recall": true_positive / (true_positive + false_negative) if true_positive + false_negative else 0.0,
+        "seconds": elapsed,
+        "throughput": len(rows) / elapsed if elapsed else float("inf"),
+    }
+
+
+def vader_cost(rows: list, sample: int = 2000) -> float:
+    """
+    Seconds per comment for sentiment scoring, what every comment the filter lets through still pays.
+    """
+    comments = [comment for _, _, comment in rows[:sample]]
+    sentiment_analysis("Warming up the engines!")
+    start = time.perf_counter()
+    for comment in comments:
+        sentiment_analysis(comment)
+    return (time.perf_counter() - start) / len(comments) if comments else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate the spam pre-filter offline.")
+    parser.add_argument("--data", type=str, help="TSV file with label, author and comment columns.")
+    parser.add_argument("--size", type=int, default=50000, help="Size of the synthetic dataset.")
+    parser.add_argument("--spam-ratio", type=float, default=0.3, help="Share of spam in the synthetic dataset.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--interval", type=float, default=0.5, help="Seconds between comments for the rate check.")
+    parser.add_argument(
+        "--positive", choices=["drop", "flagged"], default="flagged",
+        help="Count only dropped comments as spam, or dropped and deprioritized ones."
+    )
+    args = parser.parse_args()
+
+    rows = load_dataset(args.data) if args.data else synthetic_dataset(args.size, args.spam_ratio, args.seed)
+    positive = {FilterAction.DROP}
+    if args.positive == "flagged":
+        positive.add(FilterAction.DEPRIORITIZE)
+
+    spam_filter = SpamFilter()
+    report = evaluate(rows, spam_filter, args.interval, positive)
+    print(f"Comments:   {report['comments']}")
+    print(f"Precision:  {report['precision']:.3f}")
+    print(f"Recall:     {report['recall']:.3f}")
+    print(f"Throughput: {report['throughput']:,.0f} comments/s ({report['seconds']:.3f}s)")
+    filter_cost = report["seconds"] / report["comments"] if report["comments"] else 0.0
+    if SENTIMENT_ANALYZER is None:
+        print(f"Cost:       filter {filter_cost * 1e6:.1f} us/comment, VADER not available")
+    else:
+        print(f"Cost:       filter {filter_cost * 1e6:.1f} us/comment, VADER {vader_cost(rows) * 1e6:.1f} us/comment")
+    print(f"Decisions:  {', '.join(f'{action}: {count}' for action, count in spam_filter.stats.items())}")
+    print(f"Reasons:    {', '.join(f'{reason}: {count}' for reason, count in spam_filter.reason_counts.items())}")
+
+
+if __name__ == "__main__":
+    main()
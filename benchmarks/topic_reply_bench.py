@@ -0,0 +1,68 @@
+"""
+Added cost of topic detection per reply. Times the keyword index on its own, one regex per topic
+for comparison, and generate_reply with and without detection.
+"""
+import argparse
+import random
+import re
+import time
+
+from agent.text_generator import TemplateBasedTextGenerator
+from agent.topics import TOPIC_KEYWORDS, detect_topic
+from project.const import Result, Stage
+
+
+COMMENTS = [
+    "What a drive today!",
+    "Why did the team pit so late?",
+    "Those softs were graining badly after ten laps",
+    "Brilliant undercut, the strategy was perfect",
+    "Rain is coming, are you on inters?",
+    "Gutted about the crash, hope you are ok",
+    "Love the new livery",
+    "That safety car ruined the race, terrible luck",
+    "Box box! Great pit stop by the crew",
+    "Can't wait for the next race weekend, see you there",
+]
+
+
+def per_topic_patterns() -> list:
+    return [
+        (topic, re.compile(r"\b(?:" + "|".join(re.escape(keyword) for keyword in keywords) + r")\b", re.IGNORECASE))
+        for topic, keywords in TOPIC_KEYWORDS.items()
+    ]
+
+
+def time_per_call(function, comments: list) -> float:
+    start = time.perf_counter()
+    for comment in comments:
+        function(comment)
+    return (time.perf_counter() - start) / len(comments) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark topic-aware replies.")
+    parser.add_argument("--comments", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    comments = [rng.choice(COMMENTS) for _ in range(args.comments)]
+
+    indexed = time_per_call(detect_topic, comments)
+    patterns = per_topic_patterns()
+    scans = time_per_call(lambda comment: [topic for topic, pattern in patterns if pattern.search(comment)], comments)
+    print(f"Detection:  keyword index {indexed:.2f} us/comment, one regex per topic {scans:.2f} us/comment")
+
+    generator = TemplateBasedTextGenerator()
+    # Sentiment is scored up front so only the template choice and rendering are timed
+    context = {"stage": Stage.RACE, "result": Result.P1, "team_name": "Team", "race_name": "MonzaGP",
+               "racer_name": "Go", "comment_sentiment": 0.4}
+    without_topics = time_per_call(lambda comment: generator.generate_reply({**context, "comment_topic": None}, comment), comments)
+    with_topics = time_per_call(lambda comment: generator.generate_reply(context, comment), comments)
+    print(f"Replies:    {without_topics:.2f} us without topics, {with_topics:.2f} us with topics "
+          f"(+{with_topics - without_topics:.2f} us/reply)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
 import argparse
 import logging
 
+from agent.archive import PostArchive
 from agent.racer import Racer
+from agent.spam_filter import SpamFilter
 from agent.text_generator import TemplateBasedTextGenerator, TextGenerator
-from project.const import parse_stage_input
+from project.const import RESULT_MATCHER, STAGE_MATCHER, match_stage_input
 from project.logger import setup_logging
+from project.profiling import CommandProfiler
+from project.template_store import TemplateStore
 
 setup_logging()
 LOGGER = logging.getLogger(__name__)
@@ -19,16 +23,137 @@ def print_help():
     print("  result <new_result>           - Record agent's last race result (Example: P1, P5, DNF).")
     print("  racename <new_race_name>      - Set the current race name (Example MonzaGP).")
     print("  post                          - Agent generates and 'posts' a status update based on current context.")
-    print("  reply <fan_comment_text>      - Agent generates a 'reply' to the given fan comment.")
+    print("  reply [@author] <comment>     - Agent generates a 'reply' to the given fan comment. The author is optional.")
+    print("                                  Example: reply @Max Great race today!")
+    print("  filter                        - Show spam filter decisions so far.")
+    print("  archive [race_name]           - Show what the agent posted for a race (defaults to the current race).")
+    print("  profile on|off                - Profile each command with cProfile and tracemalloc, reports are written on exit.")
     print("  mention <entity> [message]    - Agent 'posts' mentioning an entity. Message is optional (defaults to 'Great job by {mention}!').")
     print("                                  Example: mention MyMechanic")
     print("                                  Example: mention Sponsor \"Great race thanks to {mention}!\"")
+    print("  mentions <e1,e2,...> [message] - Agent 'posts' one message mentioning many entities, packed into as few posts as fit.")
+    print("                                  Example: mentions Sponsor1,Sponsor2,Sponsor3 Thanks for the support")
     print("  like <post_content> [author]  - Agent 'likes' a post. Author is optional (defaults to 'Trixie').")
     print("                                  Example: like \"Well done team\"")
     print("                                  Example: like \"Good fight\" Max")
     print("\n")
 
-def interactive_loop(agent: Racer):
+# Commands handled by handle_command, only these are profiled
+COMMANDS = frozenset({
+    "state", "stage", "result", "racename", "post", "reply", "filter", "archive", "mention", "mentions", "like"
+})
+
+def handle_command(agent: Racer, command: str, args_str: str, current_race_name: str) -> str:
+    """Runs a single interactive command. Returns the, possibly updated, current race name."""
+    if command == "state":
+        print(f"  Current Stage: {agent.state.current_stage.value if agent.state.current_stage else 'Not set'} ({agent.state.current_stage.name if agent.state.current_stage else 'N/A'})")
+        if agent.state.stage_confidence < 1:
+            print(f"  Confidence:    {agent.state.stage_confidence} (fuzzy match)")
+        last_result_str = str(agent.state.last_result) if agent.state.last_result else 'N/A'
+        print(f"  Last Result:   {last_result_str}")
+        if agent.state.last_result_confidence is not None and agent.state.last_result_confidence < 1:
+            print(f"  Confidence:    {agent.state.last_result_confidence} (fuzzy match)")
+        print(f"  Racer Name:    {agent.state.racer_name}")
+        print(f"  Team Name:     {agent.state.team_name}")
+        fan_mood = ", ".join(f"{window} {average}" for window, average in agent.state.fan_mood.snapshot().items())
+        print(f"  Fan Mood:      {agent.state.fan_mood.tone() or 'neutral'} ({fan_mood})")
+        form = agent.state.history.form()
+        print(f"  Season Form:   {form['races']} races, best finish {form['best_race'] or 'N/A'}, "
+              f"best qualifying {form['best_qualifying'] or 'N/A'}, average finish {form['average_race_finish'] or 'N/A'}, "
+              f"podium streak {form['podium_streak']}")
+        print(f"  Current Race:  {current_race_name}")
+    elif command == "stage":
+        if args_str:
+            stage_match = match_stage_input(args_str, fuzzy=agent.state.fuzzy_parsing)
+            if stage_match:
+                agent.update_context_stage(stage_match.value, stage_match.confidence)
+            else:
+                LOGGER.warning(f"Invalid stage input: '{args_str}'. Please use formats like FP1, Q2, Race, Practice, Qualifying.")
+        else:
+            LOGGER.warning("Usage: stage <new_stage>")
+    elif command == "result":
+        if args_str:
+            agent.record_race_result(args_str, race_name=current_race_name)
+        else:
+            LOGGER.warning("Usage: result <new_result>")
+    elif command == "racename":
+        if args_str:
+            current_race_name = args_str
+            LOGGER.info(f"Current race name set to: {current_race_name}")
+        else:
+            LOGGER.warning("Usage: racename <new_race_name>")
+    elif command == "post":
+        post_text = agent.post_update(race_name=current_race_name)
+        print(f"Agent posted: {post_text}")
+    elif command == "reply":
+        commenter = None
+        # An optional @author in front attributes the comment, e.g. reply @Max Great race!
+        if args_str.startswith("@") and " " in args_str:
+            commenter, args_str = args_str[1:].split(" ", 1)
+        if args_str:
+            reply_text = agent.reply_to_fan(fan_comment=args_str, race_name=current_race_name, commenter=commenter)
+            if reply_text is None:
+                print(f"Comment dropped by the spam filter: {', '.join(agent.spam_filter.last_decision.reasons)}")
+            else:
+                print(f"Agent replied: {reply_text}")
+        else:
+            LOGGER.warning("Usage: reply [@author] <fan_comment_text>")
+    elif command == "filter":
+        if agent.spam_filter:
+            stats = ", ".join(f"{action}: {count}" for action, count in agent.spam_filter.stats.items())
+            print(f"  Decisions: {stats}")
+            reasons = ", ".join(f"{reason}: {count}" for reason, count in agent.spam_filter.reason_counts.items())
+            print(f"  Reasons:   {reasons or 'N/A'}")
+            if agent.spam_filter.last_decision:
+                last = agent.spam_filter.last_decision
+                print(f"  Last:      {last.action} (score {last.score}, reasons {', '.join(last.reasons) or 'none'})")
+        else:
+            LOGGER.warning("Spam filter is disabled. Run without --no-spam-filter to enable it.")
+    elif command == "archive":
+        archive = agent.action_simulator.archive
+        if archive is not None:
+            race_name = args_str or current_race_name
+            posts = archive.query(racer_name=agent.state.racer_name, race_name=race_name)
+            print(f"  {len(posts)} of {len(archive)} archived posts are from {race_name}")
+            for post in posts:
+                print(f"  [{post.stage or 'N/A'}] {post.kind}: {post.text}")
+        else:
+            LOGGER.warning("Post archive is disabled.")
+    elif command == "mention":
+        mention_args = args_str.split(" ", 1)
+        entity = mention_args[0] if mention_args else "team"
+        message = mention_args[1] if len(mention_args) > 1 else "Great job by {mention}!"
+        if entity:
+            post_text = agent.mention(entity_to_mention=entity, base_message=message, race_name=current_race_name)
+            print(f'Agent posted with mention: {post_text}')
+        else:
+            LOGGER.warning("Usage: mention <entity_to_mention> [base_message]")
+    elif command == "mentions":
+        mention_args = args_str.split(" ", 1)
+        entities = [entity.strip() for entity in mention_args[0].split(",")] if mention_args[0] else []
+        message = mention_args[1] if len(mention_args) > 1 else "Great job!"
+        if entities:
+            posts = agent.mention_many(entities, base_message=message, race_name=current_race_name, merge=True)
+            for post_text in posts:
+                print(f'Agent posted with mentions: {post_text}')
+        else:
+            LOGGER.warning("Usage: mentions <entity1,entity2,...> [base_message]")
+    elif command == "like":
+        like_args = args_str.split('" ', 1)
+        content = f'{like_args[0]}"' if like_args else ""
+        author = like_args[1] if len(like_args) > 1 else None
+        if content:
+            if author:
+                agent.like_post(post_content=content, author=author)
+            else:
+                agent.like_post(post_content=content)
+        else:
+            LOGGER.warning("Usage: like <post_content> [author]")
+    else:
+        LOGGER.warning(f"Unknown command: {command}. Type 'help' for available commands.")
+    return current_race_name
+
+def interactive_loop(agent: Racer, profiler: CommandProfiler):
     """Runs an interactive command loop to control the Racer."""
     LOGGER.info("F1 Racer Agent Interactive Mode. Type 'help' for commands, 'quit' to exit.")
     current_race_name = "SilverstoneGP"
@@ -51,64 +176,18 @@ def interactive_loop(agent: Racer):
                 break
             elif command == "help":
                 print_help()
-            elif command == "state":
-                print(f"  Current Stage: {agent.state.current_stage.value if agent.state.current_stage else 'Not set'} ({agent.state.current_stage.name if agent.state.current_stage else 'N/A'})")
-                last_result_str = str(agent.state.last_result) if agent.state.last_result else 'N/A'
-                print(f"  Last Result:   {last_result_str}")
-                print(f"  Racer Name:    {agent.state.racer_name}")
-                print(f"  Team Name:     {agent.state.team_name}")
-                print(f"  Current Race:  {current_race_name}")
-            elif command == "stage":
-                if args_str:
-                    parsed_stage = parse_stage_input(args_str)
-                    if parsed_stage:
-                        agent.update_context_stage(parsed_stage)
-                    else:
-                        LOGGER.warning(f"Invalid stage input: '{args_str}'. Please use formats like FP1, Q2, Race, Practice, Qualifying.")
-                else:
-                    LOGGER.warning("Usage: stage <new_stage>")
-            elif command == "result":
-                if args_str:
-                    agent.record_race_result(args_str)
-                else:
-                    LOGGER.warning("Usage: result <new_result>")
-            elif command == "racename":
-                if args_str:
-                    current_race_name = args_str
-                    LOGGER.info(f"Current race name set to: {current_race_name}")
+            elif command == "profile":
+                if args_str.lower() == "on":
+                    profiler.enable()
+                elif args_str.lower() == "off":
+                    profiler.disable()
                 else:
-                    LOGGER.warning("Usage: racename <new_race_name>")
-            elif command == "post":
-                post_text = agent.post_update(race_name=current_race_name)
-                print(f"Agent posted: {post_text}")
-            elif command == "reply":
-                if args_str:
-                    reply_text = agent.reply_to_fan(fan_comment=args_str, race_name=current_race_name)
-                    print(f"Agent replied: {reply_text}")
-                else:
-                    LOGGER.warning("Usage: reply <fan_comment_text>")
-            elif command == "mention":
-                mention_args = args_str.split(" ", 1)
-                entity = mention_args[0] if mention_args else "team"
-                message = mention_args[1] if len(mention_args) > 1 else "Great job by {mention}!"
-                if entity:
-                    post_text = agent.mention(entity_to_mention=entity, base_message=message, race_name=current_race_name)
-                    print(f'Agent posted with mention: {post_text}')
-                else:
-                    LOGGER.warning("Usage: mention <entity_to_mention> [base_message]")
-            elif command == "like":
-                like_args = args_str.split('" ', 1)
-                content = f'{like_args[0]}"' if like_args else ""
-                author = like_args[1] if len(like_args) > 1 else None
-                if content:
-                    if author:
-                        agent.like_post(post_content=content, author=author)
-                    else:
-                        agent.like_post(post_content=content)
-                else:
-                    LOGGER.warning("Usage: like <post_content> [author]")
+                    LOGGER.warning("Usage: profile on|off")
+            elif profiler.enabled and command in COMMANDS:
+                with profiler.profile(command):
+                    current_race_name = handle_command(agent, command, args_str, current_race_name)
             else:
-                LOGGER.warning(f"Unknown command: {command}. Type 'help' for available commands.")
+                current_race_name = handle_command(agent, command, args_str, current_race_name)
 
         except EOFError:
             LOGGER.info("\nExiting interactive mode (EOF).")
@@ -119,6 +198,9 @@ def interactive_loop(agent: Racer):
         except Exception as e:
             LOGGER.error(f"An error occurred in the loop: {e}", exc_info=True)
 
+    if profiler.has_data:
+        profiler.dump()
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run the F1 Racer AI Agent.")
     parser.add_argument(
@@ -128,16 +210,65 @@ if __name__ == "__main__":
         default="basic",
         help="Specify the text generator: 'basic'."
     )
+    parser.add_argument(
+        "--no-spam-filter",
+        action="store_true",
+        help="Disable the spam/bot pre-filter that runs ahead of sentiment scoring for replies."
+    )
+    parser.add_argument(
+        "--templates",
+        type=str,
+        help="Load templates from a corpus file built with 'python -m project.template_store'. Reloaded when it changes."
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        nargs="?",
+        const="profiles",
+        metavar="DIR",
+        help="Profile every command with cProfile and tracemalloc and write per command reports to DIR (default: profiles) on exit."
+    )
+    parser.add_argument(
+        "--fuzzy",
+        action="store_true",
+        help="Accept near misses for stages and results e.g. 'qualifyng 2' or 'p 7'. Low confidence matches are logged."
+    )
+    parser.add_argument(
+        "--fuzzy-max-distance",
+        type=int,
+        default=2,
+        help="Maximum edit distance for fuzzy stage and result matching (default: 2)."
+    )
+    parser.add_argument(
+        "--archive",
+        type=str,
+        metavar="PATH",
+        help="Append every post, reply and mention to this JSON lines file and load earlier ones on start. Kept in memory only by default."
+    )
     args = parser.parse_args()
 
     # TODO: Add different text generators
     text_gen: TextGenerator
+    templates = TemplateStore(args.templates) if args.templates else None
+    archive = PostArchive(args.archive)
     if args.text_generator == "basic":
-        text_gen = TemplateBasedTextGenerator()
+        text_gen = TemplateBasedTextGenerator(templates, archive=archive)
     else:
         LOGGER.info("Using TemplateBasedTextGenerator.")
-        text_gen = TemplateBasedTextGenerator()
+        text_gen = TemplateBasedTextGenerator(templates, archive=archive)
+
+    if args.fuzzy:
+        STAGE_MATCHER.configure(max_distance=args.fuzzy_max_distance)
+        RESULT_MATCHER.configure(max_distance=args.fuzzy_max_distance)
+
+    spam_filter = None if args.no_spam_filter else SpamFilter()
+    agent = Racer(
+        text_generator=text_gen, racer_name="Go Mifune", team_name="Mach 5", spam_filter=spam_filter,
+        fuzzy_parsing=args.fuzzy, archive=archive
+    )
 
-    agent = Racer(text_generator=text_gen, racer_name="Go Mifune", team_name="Mach 5")
+    profiler = CommandProfiler(output_dir=args.profile or "profiles")
+    if args.profile:
+        profiler.enable()
 
-    interactive_loop(agent)
+    interactive_loop(agent, profiler)
@@ -0,0 +1,167 @@
+"""
+Fuzzy matching of free text against a fixed set of aliases e.g. "qualifyng 2" or "free practise 3".
+The aliases are indexed once in a BK-tree so a lookup only computes the edit distance to a small
+part of the aliases instead of all of them. A trailing number is never fuzzy matched, "p 21" is not
+a near miss of "p 1".
+"""
+import logging
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
+
+
+LOGGER = logging.getLogger(__name__)
+
+_whitespace_pattern = re.compile(r"\s+")
+# Splits "qualifying 2" or "p7" into the words and the number
+_number_pattern = re.compile(r"^(.*?)\s*(\d+)$")
+_digit_pattern = re.compile(r"\d")
+
+
+def split_number(text: str) -> tuple:
+    """
+    ("qualifying", "2") for "qualifying 2", (text, None) without a trailing number. Leading zeros
+    are dropped so "p 07" and "p7" share a number.
+    """
+    match = _number_pattern.match(text)
+    if match is None:
+        return text, None
+    return match.group(1), str(int(match.group(2)))
+
+
+def levenshtein(a: str, b: str) -> int:
+    """
+    Edit distance between two strings, insertions, deletions and substitutions all cost 1.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        previous = current
+    return previous[-1]
+
+
+class FuzzyMatch(NamedTuple):
+    value: Any
+    alias: str
+    distance: int
+    confidence: float
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over edit distance. Every node is [term, {distance: child}].
+    """
+    def __init__(self, terms=()):
+        self._root: Optional[list] = None
+        self.size = 0
+        for term in terms:
+            self.add(term)
+
+    def add(self, term: str):
+        self.size += 1
+        if self._root is None:
+            self._root = [term, {}]
+            return
+        node = self._root
+        while True:
+            distance = levenshtein(term, node[0])
+            if distance == 0:
+                self.size -= 1
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [term, {}]
+                return
+            node = child
+
+    def search(self, term: str, max_distance: int) -> list:
+        """
+        Returns (distance, term) pairs within `max_distance` of `term`, closest first.
+        """
+        if self._root is None:
+            return []
+        found = []
+        stack = [self._root]
+        while stack:
+            node_term, children = stack.pop()
+            distance = levenshtein(term, node_term)
+            if distance <= max_distance:
+                found.append((distance, node_term))
+            # Triangle inequality, only children in this distance band can be close enough
+            for child_distance, child in children.items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        found.sort()
+        return found
+
+
+class FuzzyMatcher:
+    """
+    Maps text to the value of the closest alias. Only the words are fuzzy matched, a trailing number
+    has to be one the aliases use and is matched exactly. Results are memoized, matches below
+    `audit_threshold` confidence are kept in `audit_log` for review.
+    """
+    def __init__(
+            self, aliases: dict, max_distance: int = 2, min_confidence: float = 0.7,
+            audit_threshold: float = 0.85, cache_size: int = 4096
+            ):
+        self.aliases = {self.normalize(alias): value for alias, value in aliases.items()}
+        # One tree of word parts per trailing number (None for aliases without one), and the alias
+        # each (words, number) pair came from
+        self._alias_parts: dict = {}
+        for alias in self.aliases:
+            self._alias_parts.setdefault(split_number(alias), alias)
+        self.trees: dict = {}
+        for words, number in self._alias_parts:
+            self.trees.setdefault(number, BKTree()).add(words)
+        self.max_distance = max_distance
+        self.min_confidence = min_confidence
+        self.audit_threshold = audit_threshold
+        self.audit_log: deque = deque(maxlen=1000)
+        self._cached_match = lru_cache(maxsize=cache_size)(self._match)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return _whitespace_pattern.sub(" ", text.lower()).strip()
+
+    def configure(self, max_distance: Optional[int] = None, min_confidence: Optional[float] = None):
+        """
+        Changes the thresholds and drops the memoized results that were based on the old ones.
+        """
+        if max_distance is not None:
+            self.max_distance = max_distance
+        if min_confidence is not None:
+            self.min_confidence = min_confidence
+        self._cached_match.cache_clear()
+
+    def _match(self, text: str) -> Optional[FuzzyMatch]:
+        if text in self.aliases:
+            return FuzzyMatch(self.aliases[text], text, 0, 1.0)
+        words, number = split_number(text)
+        tree = self.trees.get(number)
+        # Unknown numbers and digits anywhere else are never guessed at
+        if tree is None or _digit_pattern.search(words):
+            return None
+        best = None
+        for distance, alias_words in tree.search(words, self.max_distance):
+            confidence = round(1 - distance / max(len(words), len(alias_words), 1), 3)
+            if confidence >= self.min_confidence and (best is None or confidence > best.confidence):
+                alias = self._alias_parts[(alias_words, number)]
+                best = FuzzyMatch(self.aliases[alias], alias, distance, confidence)
+        return best
+
+    def match(self, text: str) -> Optional[FuzzyMatch]:
+        match = self._cached_match(self.normalize(text))
+        if match and match.confidence < self.audit_threshold:
+            self.audit_log.append((text, match))
+            LOGGER.info(f"Low confidence match: '{text}' -> '{match.alias}' ({match.confidence})")
+        return match
@@ -0,0 +1,129 @@
+"""
+Per command profiling with cProfile and tracemalloc. Nothing here runs unless profiling is enabled,
+the interactive loop only checks `CommandProfiler.enabled` before dispatching a command.
+"""
+import cProfile
+import io
+import logging
+import pathlib
+import pstats
+import re
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+
+LOGGER = logging.getLogger(__name__)
+
+UNSAFE_FILE_CHARS = re.compile(r"[^\w-]")
+
+
+class CommandProfiler:
+    """
+    Aggregates cProfile stats and allocation sites per command type and dumps them to
+    `output_dir` as <command>.prof (loadable with pstats/snakeviz) and <command>.txt reports.
+    """
+    def __init__(self, output_dir: str = "profiles", top: int = 25, frames: int = 1):
+        self.output_dir = pathlib.Path(output_dir)
+        self.top = top
+        self.frames = frames
+        self.enabled = False
+        self._started_tracemalloc = False
+        self._stats: dict = {}
+        self._allocations: dict = defaultdict(Counter)
+        self._calls: Counter = Counter()
+        self._seconds: Counter = Counter()
+        self._snapshot_filters = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        )
+
+    def enable(self):
+        if self.enabled:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracemalloc = True
+        self.enabled = True
+        LOGGER.info(f"Profiling enabled, reports are written to {self.output_dir} on exit")
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        LOGGER.info("Profiling disabled")
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(self._snapshot_filters)
+
+    @contextmanager
+    def profile(self, command: str):
+        """
+        Profiles the wrapped block and adds the results to the totals for `command`.
+        """
+        profiler = cProfile.Profile()
+        before = self._snapshot()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            self._seconds[command] += time.perf_counter() - start
+            self._calls[command] += 1
+            for stat in self._snapshot().compare_to(before, "lineno"):
+                if stat.size_diff > 0:
+                    self._allocations[command][str(stat.traceback[0])] += stat.size_diff
+            if command in self._stats:
+                self._stats[command].add(profiler)
+            else:
+                self._stats[command] = pstats.Stats(profiler)
+
+    @property
+    def has_data(self) -> bool:
+        return bool(self._calls)
+
+    def _report(self, command: str) -> str:
+        stream = io.StringIO()
+        calls = self._calls[command]
+        seconds = self._seconds[command]
+        stream.write(f"Command: {command}\n")
+        stream.write(f"Calls: {calls}, total {seconds:.4f}s, mean {seconds / calls * 1000:.3f}ms\n\n")
+        stream.write(f"Top {self.top} allocation sites (bytes allocated and not freed during the command):\n")
+        for site, size in self._allocations[command].most_common(self.top):
+            stream.write(f"  {size:>12,}  {site}\n")
+        stream.write(f"\nTop {self.top} functions by cumulative time:\n")
+        stats = self._stats[command]
+        stats.stream = stream
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        return stream.getvalue()
+
+    @staticmethod
+    def _file_stem(command: str) -> str:
+        # Commands come from user input, keep them to a plain file name inside output_dir
+        return UNSAFE_FILE_CHARS.sub("_", command) or "_"
+
+    def dump(self):
+        """
+        Writes the aggregated stats and reports for every profiled command type. A report that can
+        not be written is logged and skipped, the others are still written.
+        """
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            LOGGER.error(f"Could not create {self.output_dir}, no profiles written: {e}")
+            return
+        written = []
+        for command in self._calls:
+            stem = self._file_stem(command)
+            try:
+                self._stats[command].dump_stats(self.output_dir / f"{stem}.prof")
+                (self.output_dir / f"{stem}.txt").write_text(self._report(command), encoding="utf-8")
+                written.append(command)
+            except OSError as e:
+                LOGGER.error(f"Could not write the profile for '{command}': {e}")
+        LOGGER.info(f"Wrote profiles for {', '.join(written) or 'no commands'} to {self.output_dir}")
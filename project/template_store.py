@@ -0,0 +1,209 @@
+"""
+External template corpus. Templates are stored in a compact offset-indexed file that is memory
+mapped, a bucket is only decoded the first time it is used. The file is reloaded when it changes.
+
+File layout (little endian):
+    magic (4 bytes) | version (uint16) | index length (uint32) | JSON index | bucket data
+The index maps a bucket name to [offset, length, count] and bucket data is the UTF-8 templates
+joined by a record separator.
+"""
+import argparse
+import json
+import logging
+import mmap
+import os
+import re
+import struct
+import time
+from collections.abc import Mapping
+from typing import Optional
+
+from project.const import REQUIRED_TEMPLATE_BUCKETS, TEMPLATES, template_placeholders
+
+
+LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"F1TP"
+VERSION = 1
+HEADER = struct.Struct("<4sHI")
+SEPARATOR = "\x1e"
+# Scans the raw bytes for {placeholder} without decoding any bucket
+PLACEHOLDER_PATTERN = re.compile(rb"(?<!\{)\{([^{}!:]*)(?:[!:][^{}]*)?\}")
+
+
+class TemplateCorpusError(ValueError):
+    pass
+
+
+def write_template_corpus(path: str, templates: dict):
+    """
+    Writes a template corpus file. The file is written next to the target and swapped in, so a
+    running TemplateStore never sees a half written corpus.
+    """
+    index = {}
+    chunks = []
+    offset = 0
+    for bucket, template_list in templates.items():
+        if any(SEPARATOR in template for template in template_list):
+            raise TemplateCorpusError(f"Templates in '{bucket}' can not contain the record separator")
+        data = SEPARATOR.join(template_list).encode("utf-8")
+        index[bucket] = [offset, len(data), len(template_list)]
+        chunks.append(data)
+        offset += len(data)
+
+    index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(index_bytes)))
+        f.write(index_bytes)
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+
+
+class TemplateStore(Mapping):
+    """
+    Read only mapping of bucket name to templates backed by a corpus file. Works anywhere the
+    TEMPLATES dict does. Checks the file for changes at most every `reload_interval` seconds and
+    keeps serving the old corpus if the new one does not validate.
+    """
+    def __init__(
+            self, path: str, reload_interval: float = 2.0,
+            required_buckets: tuple = REQUIRED_TEMPLATE_BUCKETS,
+            placeholders_for=template_placeholders
+            ):
+        self.path = path
+        self.reload_interval = reload_interval
+        self.required_buckets = required_buckets
+        # Bucket name -> placeholders its templates may use
+        self.placeholders_for = placeholders_for
+        self._mmap: Optional[mmap.mmap] = None
+        self._index: dict = {}
+        self._data_start = 0
+        self._cache: dict = {}
+        self._file_signature = None
+        self._last_check = 0.0
+        self._load()
+
+    def _load(self):
+        """
+        Maps the file, parses the index and validates the corpus before swapping it in.
+        """
+        stat = os.stat(self.path)
+        with open(self.path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            index, data_start = self._parse(mapped)
+            self._validate(mapped, index, data_start)
+        except (TemplateCorpusError, ValueError, struct.error):
+            mapped.close()
+            raise
+
+        old_mmap = self._mmap
+        self._mmap, self._index, self._data_start = mapped, index, data_start
+        self._cache = {}
+        self._file_signature = (stat.st_mtime_ns, stat.st_size)
+        self._last_check = time.monotonic()
+        if old_mmap is not None:
+            old_mmap.close()
+        LOGGER.info(f"Loaded {len(index)} template buckets from {self.path}")
+
+    def _parse(self, mapped: mmap.mmap) -> tuple:
+        if len(mapped) < HEADER.size:
+            raise TemplateCorpusError(f"{self.path} is too small to be a template corpus")
+        magic, version, index_length = HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC or version != VERSION:
+            raise TemplateCorpusError(f"{self.path} is not a version {VERSION} template corpus")
+        index = json.loads(mapped[HEADER.size:HEADER.size + index_length])
+        if not isinstance(index, dict) or not all(
+                isinstance(entry, list) and len(entry) == 3 and all(isinstance(value, int) for value in entry)
+                for entry in index.values()
+                ):
+            raise TemplateCorpusError(f"{self.path} has a malformed index")
+        return index, HEADER.size + index_length
+
+    def _validate(self, mapped: mmap.mmap, index: dict, data_start: int):
+        missing = [bucket for bucket in self.required_buckets if bucket not in index]
+        if missing:
+            raise TemplateCorpusError(f"{self.path} is missing required buckets: {', '.join(missing)}")
+        data_length = len(mapped) - data_start
+        for bucket, (offset, length, _) in index.items():
+            if offset < 0 or length < 0 or offset + length > data_length:
+                raise TemplateCorpusError(f"Bucket '{bucket}' points outside of {self.path}")
+            start = data_start + offset
+            placeholders = {match.decode("utf-8") for match in PLACEHOLDER_PATTERN.findall(mapped, start, start + length)}
+            unknown = placeholders - self.placeholders_for(bucket)
+            if unknown:
+                raise TemplateCorpusError(
+                    f"Bucket '{bucket}' in {self.path} uses placeholders it is not rendered with: {', '.join(sorted(unknown))}"
+                )
+
+    def maybe_reload(self):
+        """
+        Reloads the corpus if the file changed since it was loaded.
+        """
+        now = time.monotonic()
+        if now - self._last_check < self.reload_interval:
+            return
+        self._last_check = now
+        try:
+            stat = os.stat(self.path)
+        except OSError as e:
+            LOGGER.error(f"Could not check {self.path} for changes, keeping the current corpus: {e}")
+            return
+        if (stat.st_mtime_ns, stat.st_size) == self._file_signature:
+            return
+        try:
+            self._load()
+        except (OSError, TemplateCorpusError, ValueError, struct.error) as e:
+            LOGGER.error(f"Could not reload templates from {self.path}, keeping the current corpus: {e}")
+            # Do not retry a broken file until it changes again
+            self._file_signature = (stat.st_mtime_ns, stat.st_size)
+
+    def __getitem__(self, bucket: str) -> list:
+        self.maybe_reload()
+        template_list = self._cache.get(bucket)
+        if template_list is None:
+            offset, length, _ = self._index[bucket]
+            start = self._data_start + offset
+            template_list = self._mmap[start:start + length].decode("utf-8").split(SEPARATOR)
+            self._cache[bucket] = template_list
+        return template_list
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, bucket):
+        return bucket in self._index
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a template corpus file.")
+    parser.add_argument("output", type=str, help="Path of the corpus file to write.")
+    parser.add_argument(
+        "--source", type=str,
+        help="JSON file mapping bucket names to lists of templates. Defaults to the built in templates."
+    )
+    args = parser.parse_args()
+
+    templates = TEMPLATES
+    if args.source:
+        with open(args.source, encoding="utf-8") as f:
+            templates = json.load(f)
+    write_template_corpus(args.output, templates)
+    # Load it back so a broken corpus is caught at build time
+    store = TemplateStore(args.output)
+    print(f"Wrote {len(store)} buckets ({sum(len(v) for v in templates.values())} templates) to {args.output}")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Regression checks for fuzzy stage and result parsing, numbers must never be fuzzy matched
+"""
+import pytest
+
+from project.const import Result, Stage, match_stage_input, parse_stage_input
+
+
+@pytest.mark.parametrize("text", ["p 21", "p 30", "p 0", "P 99", "top 6", "p21 finish", "tpo 5"])
+def test_result_numbers_are_not_guessed(text):
+    assert Result.match_string(text, fuzzy=True) is None
+
+
+@pytest.mark.parametrize("text", ["qualifying 4", "qualifying 9", "practice 4", "fp 4", "q 0"])
+def test_stage_numbers_are_not_guessed(text):
+    assert parse_stage_input(text, fuzzy=True) is None
+    assert match_stage_input(text, fuzzy=True) is None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("p 7", Result.P7),
+    ("podum", Result.TOP_3),
+    ("did not finsh", Result.DNF),
+])
+def test_result_near_misses(text, expected):
+    assert Result.match_string(text, fuzzy=True).value == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("qualifyng 2", Stage.Q2),
+    ("free practise 3", Stage.FP3),
+    ("grand pri", Stage.RACE),
+])
+def test_stage_near_misses(text, expected):
+    match = match_stage_input(text, fuzzy=True)
+    assert match.value == expected
+    assert match.confidence < 1
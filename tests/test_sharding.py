@@ -0,0 +1,52 @@
+"""
+Regression checks for the sharded runtime staying in step with its workers after a failure
+"""
+import os
+import signal
+
+import pytest
+
+from agent.sharding import ShardedRuntime, ShardError
+
+
+def _racer_per_worker(runtime: ShardedRuntime) -> dict:
+    owners = {}
+    for i in range(100):
+        racer_id = f"racer{i}"
+        worker_id = runtime.ring.get(racer_id)
+        if worker_id not in owners:
+            runtime.register(racer_id, racer_id, "Team", spam_filter=False)
+            owners[worker_id] = racer_id
+        if len(owners) == len(runtime.workers):
+            break
+    return owners
+
+
+def test_call_many_skips_responses_owed_by_live_workers_after_a_failure():
+    with ShardedRuntime(workers=2) as runtime:
+        owners = _racer_per_worker(runtime)
+        dead, live = runtime.workers
+        os.kill(runtime._workers[dead].process.pid, signal.SIGKILL)
+        runtime._workers[dead].process.join()
+
+        commands = [(owners[live], "stage", "race"), (owners[dead], "stage", "race"), (owners[live], "stage", "q1")]
+        with pytest.raises(ShardError):
+            runtime.call_many(commands * 3)
+
+        assert runtime.call(owners[live], "stage", "fp1") == "FP1"
+        assert runtime.call(owners[live], "stage", "q2") == "Q2"
+
+
+def test_request_to_a_hung_worker_times_out():
+    with ShardedRuntime(workers=1, timeout=0.5) as runtime:
+        racer_id = _racer_per_worker(runtime)[runtime.workers[0]]
+        pid = runtime._workers[runtime.workers[0]].process.pid
+        os.kill(pid, signal.SIGSTOP)
+        try:
+            with pytest.raises(ShardError):
+                runtime.call(racer_id, "stage", "race")
+            assert not runtime.health_check(timeout=0.2)[runtime.workers[0]]["alive"]
+        finally:
+            os.kill(pid, signal.SIGCONT)
+        # The late responses are skipped, the next call gets its own result
+        assert runtime.call(racer_id, "stage", "fp2") == "FP2"